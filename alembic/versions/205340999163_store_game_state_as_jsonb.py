@@ -0,0 +1,27 @@
+"""Store game state as JSONB
+
+Revision ID: 205340999163
+Revises: fcf462f1cca8
+Create Date: 2026-10-15 12:41:09.873310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '205340999163'
+down_revision = 'fcf462f1cca8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('games', 'initial_setup_json', type_=postgresql.JSONB(), existing_type=sa.JSON(), existing_nullable=False, postgresql_using='initial_setup_json::jsonb')
+    op.alter_column('games', 'current_state_json', type_=postgresql.JSONB(), existing_type=sa.JSON(), existing_nullable=False, postgresql_using='current_state_json::jsonb')
+
+
+def downgrade() -> None:
+    op.alter_column('games', 'current_state_json', type_=sa.JSON(), existing_type=postgresql.JSONB(), existing_nullable=False, postgresql_using='current_state_json::json')
+    op.alter_column('games', 'initial_setup_json', type_=sa.JSON(), existing_type=postgresql.JSONB(), existing_nullable=False, postgresql_using='initial_setup_json::json')
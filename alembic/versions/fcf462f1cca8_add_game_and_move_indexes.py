@@ -0,0 +1,33 @@
+"""Add game list and move replay indexes
+
+Revision ID: fcf462f1cca8
+Revises: 4dd6632f1782
+Create Date: 2026-10-15 12:04:31.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fcf462f1cca8'
+down_revision = '4dd6632f1782'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_games_white_created', 'games', ['white_player_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('idx_games_black_created', 'games', ['black_player_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('idx_games_status_created', 'games', ['status', sa.text('created_at DESC')], unique=False, postgresql_where=sa.text("status = 'ongoing'"))
+    op.create_index('idx_moves_game_move', 'moves', ['game_id', 'move_number'], unique=False, postgresql_include=['from_square', 'to_square', 'piece_type'])
+    # The composite index above has game_id as its prefix
+    op.drop_index('ix_moves_game_id', table_name='moves')
+
+
+def downgrade() -> None:
+    op.create_index('ix_moves_game_id', 'moves', ['game_id'], unique=False)
+    op.drop_index('idx_moves_game_move', table_name='moves')
+    op.drop_index('idx_games_status_created', table_name='games', postgresql_where=sa.text("status = 'ongoing'"))
+    op.drop_index('idx_games_black_created', table_name='games')
+    op.drop_index('idx_games_white_created', table_name='games')
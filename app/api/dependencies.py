@@ -4,34 +4,37 @@ API dependencies for authentication and database access.
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from uuid import UUID
 
 from ..core.security import verify_token
 from ..db.database import get_db
 from ..db.models import User
+from ..schemas.user import UserResponse
+from ..services.redis_client import cache_user, get_cached_user
 
 
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> UUID:
     """
-    Dependency to get the currently authenticated user.
+    Dependency to get the authenticated user's ID from the JWT alone.
+    
+    Use this for endpoints that only need the ID - it skips Redis and the database.
     
     Raises:
-        HTTPException: 401 if token is invalid or user not found
+        HTTPException: 401 if token is invalid
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     # Verify and decode token
     payload = verify_token(token)
     if payload is None:
@@ -41,9 +44,34 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    # Get user from database
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
+    try:
+        return UUID(user_id)
+    except ValueError:
+        raise credentials_exception
+
+
+async def get_current_user(
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Dependency to get the currently authenticated user.
+    
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    # Try cache first (hot path) - avoids a Postgres round-trip per request
+    cached = await get_cached_user(str(user_id))
+    if cached:
+        return User(**UserResponse.model_validate(cached).model_dump())
+    
+    # Fallback to database (cold path) - the password hash is never needed here
+    user = await db.scalar(
+        select(User).options(defer(User.hashed_password)).where(User.id == user_id)
+    )
     if user is None:
         raise credentials_exception
     
+    await cache_user(str(user_id), UserResponse.model_validate(user).model_dump(mode="json"))
+    
     return user
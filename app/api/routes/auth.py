@@ -2,43 +2,67 @@
 Authentication API routes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
+from uuid import UUID
+import anyio
 
-from app.db.database import get_db
+from app.db.database import get_db, SessionLocal
 from app.db.models import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash, verify_password, password_needs_rehash, create_access_token
+from app.services.redis_client import delete_cached_user
 
 
 router = APIRouter()
 
 
+async def record_last_login(user_id: UUID, login_time: datetime):
+    """
+    Persist a user's last_login timestamp and drop their cached profile.
+    
+    Runs as a background task after the login response has been sent,
+    so it uses its own database session.
+    """
+    async with SessionLocal() as db:
+        await db.execute(update(User).where(User.id == user_id).values(last_login=login_time))
+        await db.commit()
+    
+    await delete_cached_user(str(user_id))
+
+
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new user account.
     
     Returns JWT access token upon successful creation.
     """
-    # Check if username already exists
-    if db.query(User).filter(User.username == user_data.username).first():
+    # Check username and email uniqueness in a single query
+    result = await db.execute(
+        select(User.username, User.email).where(
+            (User.username == user_data.username) | (User.email == user_data.email)
+        )
+    )
+    existing = result.first()
+    
+    if existing and existing.username == user_data.username:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
     
-    # Check if email already exists
-    if db.query(User).filter(User.email == user_data.email).first():
+    if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # Create new user (hashing is CPU-bound - keep it off the event loop)
+    hashed_password = await anyio.to_thread.run_sync(get_password_hash, user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -46,8 +70,7 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
     
     # Create access token
     access_token = create_access_token(data={"sub": str(new_user.id)})
@@ -56,7 +79,11 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(
+    background_tasks: BackgroundTasks,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Login with email and password.
     
@@ -64,18 +91,23 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     Returns JWT access token upon successful authentication.
     """
     # Find user by email (username field in OAuth2 form)
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await db.scalar(select(User).where(User.email == form_data.username))
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Password hashing is CPU-bound - run it in a worker thread, not on the event loop
+    if not user or not await anyio.to_thread.run_sync(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    # Upgrade legacy hashes while we have the plain password
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await anyio.to_thread.run_sync(get_password_hash, form_data.password)
+        await db.commit()
+    
+    # Update last login after the response is sent (keeps the write off the login latency)
+    background_tasks.add_task(record_last_login, user.id, datetime.utcnow())
     
     # Create access token
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -3,25 +3,32 @@ Game API routes.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from uuid import UUID
 from typing import List, Optional
+from datetime import datetime
+import secrets
 
 from app.db.database import get_db
 from app.db.models import User, GameModel
 from app.schemas.game import GameCreate, GameResponse, MoveRequest, MoveResponse, GameListItem, PlayerInfo, ValidMovesResponse
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_current_user_id
 from app.services import game_service
 
 
 router = APIRouter()
 
+# Columns PlayerInfo needs - keeps hashed_password and stats out of game queries
+PLAYER_INFO_COLUMNS = (User.id, User.username, User.elo_rating)
+
 
 @router.post("", response_model=GameResponse, status_code=status.HTTP_201_CREATED)
-def create_game(
+async def create_game(
     game_data: GameCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new Chess 39 game.
@@ -36,31 +43,29 @@ def create_game(
         )
     
     # Verify opponent exists
-    opponent = db.query(User).filter(User.id == game_data.opponent_id).first()
+    opponent = await db.get(User, game_data.opponent_id)
     if not opponent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Opponent not found"
         )
     
-    # Randomly assign colors (simplified - could be more sophisticated)
-    import random
-    if random.choice([True, False]):
+    # Randomly assign colors (one random bit - no list or PRNG state involved)
+    if secrets.randbits(1):
         white_id, black_id = current_user.id, game_data.opponent_id
     else:
         white_id, black_id = game_data.opponent_id, current_user.id
     
-    # Create game
-    game = game_service.create_game(white_id, black_id, db)
+    # Create game (the service hands back the state it just stored)
+    game, state = await game_service.create_game(white_id, black_id, db)
     
-    # Load game state for response
-    game_obj = game_service.load_game(game.id, db)
-    state = game_obj.get_state()
+    # Both players are already loaded - no need to go through the relationships
+    white, black = (current_user, opponent) if white_id == current_user.id else (opponent, current_user)
     
     return GameResponse(
         id=game.id,
-        white_player=PlayerInfo(id=game.white_player.id, username=game.white_player.username, elo_rating=game.white_player.elo_rating),
-        black_player=PlayerInfo(id=game.black_player.id, username=game.black_player.username, elo_rating=game.black_player.elo_rating),
+        white_player=PlayerInfo(id=white.id, username=white.username, elo_rating=white.elo_rating),
+        black_player=PlayerInfo(id=black.id, username=black.username, elo_rating=black.elo_rating),
         board=state['board'],
         current_turn=state['current_turn'],
         status=state['status'],
@@ -72,13 +77,21 @@ def create_game(
 
 
 @router.get("/{game_id}", response_model=GameResponse)
-def get_game(game_id: UUID, db: Session = Depends(get_db)):
+async def get_game(game_id: UUID, db: AsyncSession = Depends(get_db)):
     """Get current game state."""
-    db_game = db.query(GameModel).filter(GameModel.id == game_id).first()
+    db_game = await db.scalar(
+        select(GameModel)
+        .options(
+            joinedload(GameModel.white_player).load_only(*PLAYER_INFO_COLUMNS),
+            joinedload(GameModel.black_player).load_only(*PLAYER_INFO_COLUMNS),
+            joinedload(GameModel.winner).load_only(*PLAYER_INFO_COLUMNS)
+        )
+        .where(GameModel.id == game_id)
+    )
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    game_obj = game_service.load_game(game_id, db)
+    game_obj = await game_service.load_game_from_row(db_game, use_local_cache=True)
     state = game_obj.get_state()
     
     return GameResponse(
@@ -97,22 +110,26 @@ def get_game(game_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("", response_model=List[GameListItem])
-def list_games(
+async def list_games(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """List user's games with optional status filter."""
-    query = db.query(GameModel).filter(
-        (GameModel.white_player_id == current_user.id) | (GameModel.black_player_id == current_user.id)
+    # Eager-load both players in the same SELECT to avoid one query per game
+    query = select(GameModel).options(
+        joinedload(GameModel.white_player).load_only(*PLAYER_INFO_COLUMNS),
+        joinedload(GameModel.black_player).load_only(*PLAYER_INFO_COLUMNS)
+    ).where(
+        (GameModel.white_player_id == current_user_id) | (GameModel.black_player_id == current_user_id)
     )
     
     if status:
-        query = query.filter(GameModel.status == status)
+        query = query.where(GameModel.status == status)
     
-    games = query.order_by(GameModel.created_at.desc()).offset(offset).limit(limit).all()
+    games = (await db.scalars(query.order_by(GameModel.created_at.desc()).offset(offset).limit(limit))).all()
     
     return [
         GameListItem(
@@ -129,46 +146,61 @@ def list_games(
 
 
 @router.post("/{game_id}/move", response_model=MoveResponse)
-def make_move(
+async def make_move(
     game_id: UUID,
     move_data: MoveRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Submit a move in a game."""
-    return game_service.make_move(
+    return await game_service.make_move(
         game_id,
         move_data.from_square,
         move_data.to_square,
-        current_user.id,
+        current_user_id,
         move_data.promotion_piece,
         db
     )
 
 
 @router.post("/{game_id}/resign", response_model=dict)
-def resign_game(
+async def resign_game(
     game_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Resign from a game."""
-    game_obj = game_service.load_game(game_id, db)
+    game_obj, db_game = await game_service.load_game_with_row(game_id, db)
     if not game_obj:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    result = game_obj.resign(str(current_user.id))
+    # Only the two players may resign a game
+    if current_user_id not in (db_game.white_player_id, db_game.black_player_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not a player in this game"
+        )
+    
+    result = game_obj.resign(str(current_user_id))
     
     if result['success']:
-        # Update database
-        db_game = db.query(GameModel).filter(GameModel.id == game_id).first()
+        # Update database, including the stored state so the game stops accepting moves
+        new_state = game_obj.get_state()
+        db_game.current_state_json = new_state
         db_game.status = 'resignation'
-        db_game.winner_id = UUID(game_obj.winner)
-        db_game.completed_at = db.query(db.func.now()).scalar()
+        db_game.winner_id = game_service.get_winner_id(db_game, game_obj.winner)
+        db_game.completed_at = datetime.utcnow()
+        
+        # Update ELO (committed together with the result)
+        await game_service.update_elo_ratings(db_game, db)
         
-        # Update ELO
-        game_service.update_elo_ratings(db_game, db)
+        await db.commit()
+        await game_service.delete_cached_players(db_game)
         
-        db.commit()
+        await game_service.publish_game_update(game_id, new_state, {
+            'type': 'game_resigned',
+            'winner': game_obj.winner,
+            'game_state': new_state
+        })
     
     return result
@@ -11,9 +11,16 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    # Per worker: Postgres max_connections must be at least
+    # WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
     
     # Redis
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50  # Per worker, pub/sub subscriptions included
+    REDIS_POOL_TIMEOUT: int = 10  # Seconds to wait for a free connection
     
     # Security
     SECRET_KEY: str
@@ -4,20 +4,34 @@ Security utilities for authentication and password hashing.
 
 from datetime import datetime, timedelta
 from typing import Optional
-import hashlib
 from jose import JWTError, jwt
+from passlib.context import CryptContext
 from .config import settings
 
 
+# bcrypt with 12 rounds (~100-250ms per hash). Plain SHA-256 hex digests from
+# older accounts still verify and are flagged for rehashing.
+# Hashing is CPU-bound: call these from a worker thread in async endpoints.
+pwd_context = CryptContext(
+    schemes=["bcrypt", "hex_sha256"],
+    deprecated=["hex_sha256"],
+    bcrypt__rounds=12
+)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    password_hash = hashlib.sha256(plain_password.encode()).hexdigest()
-    return password_hash == hashed_password
+    return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password for storage using SHA-256."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash a password for storage using bcrypt."""
+    return pwd_context.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check if a stored hash uses a deprecated scheme or outdated settings."""
+    return pwd_context.needs_update(hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
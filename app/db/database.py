@@ -2,33 +2,39 @@
 Database connection and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
 
 
+# The app talks to Postgres through asyncpg; Alembic keeps using
+# DATABASE_URL as-is with the sync driver.
+ASYNC_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,  # Connections kept open
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed under burst load
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections before server-side timeouts
     pool_pre_ping=True,  # Verify connections before using
     echo=False  # Set to True to log all SQL queries
 )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: attributes stay readable after commit without
+# another round-trip (async sessions cannot lazy-load on attribute access)
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Base class for ORM models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
     Dependency that provides a database session.
     Automatically closes the session after use.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -2,21 +2,37 @@
 SQLAlchemy ORM models for Chess 39.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
+import os
+import time
 import uuid
 
 from .database import Base
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The high 48 bits are the Unix timestamp in milliseconds, so new rows land
+    at the right edge of the primary-key B-tree instead of at random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class User(Base):
     """User account model."""
     
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
@@ -53,15 +69,15 @@ class GameModel(Base):
     
     __tablename__ = "games"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Players
     white_player_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     black_player_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
-    # Game state (stored as JSON)
-    initial_setup_json = Column(JSON, nullable=False)  # Random piece configuration
-    current_state_json = Column(JSON, nullable=False)  # Current board state
+    # Game state (stored as binary JSONB - parsed once on write, queryable)
+    initial_setup_json = Column(JSONB, nullable=False)  # Random piece configuration
+    current_state_json = Column(JSONB, nullable=False)  # Current board state
     
     # Game status
     status = Column(String(20), nullable=False, default="ongoing")  # ongoing, checkmate, stalemate, resignation, draw
@@ -72,6 +88,18 @@ class GameModel(Base):
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     
+    # Indexes backing list_games: "my games, newest first", optionally by status
+    __table_args__ = (
+        Index("idx_games_white_created", white_player_id, created_at.desc()),
+        Index("idx_games_black_created", black_player_id, created_at.desc()),
+        Index(
+            "idx_games_status_created",
+            status,
+            created_at.desc(),
+            postgresql_where=text("status = 'ongoing'")
+        ),
+    )
+    
     # Relationships
     white_player = relationship(
         "User",
@@ -84,7 +112,15 @@ class GameModel(Base):
         back_populates="games_as_black"
     )
     winner = relationship("User", foreign_keys=[winner_id])
-    moves = relationship("Move", back_populates="game", cascade="all, delete-orphan")
+    # Not eager by default: the move list grows every turn and most game loads
+    # only need the current state. Use selectinload(GameModel.moves) when
+    # reading moves for several games at once.
+    moves = relationship(
+        "Move",
+        back_populates="game",
+        cascade="all, delete-orphan",
+        order_by="Move.move_number"
+    )
     
     def __repr__(self):
         return f"<Game {self.id} ({self.status})>"
@@ -96,7 +132,7 @@ class Move(Base):
     __tablename__ = "moves"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    game_id = Column(UUID(as_uuid=True), ForeignKey("games.id"), nullable=False, index=True)
+    game_id = Column(UUID(as_uuid=True), ForeignKey("games.id"), nullable=False)
     
     # Move details
     move_number = Column(Integer, nullable=False)  # Full move number (increments after black moves)
@@ -116,6 +152,16 @@ class Move(Base):
     # Timestamp
     timestamp = Column(DateTime, default=datetime.utcnow)
     
+    # Covering index for move replay (also serves plain game_id lookups)
+    __table_args__ = (
+        Index(
+            "idx_moves_game_move",
+            game_id,
+            move_number,
+            postgresql_include=["from_square", "to_square", "piece_type"]
+        ),
+    )
+    
     # Relationships
     game = relationship("GameModel", back_populates="moves")
     
@@ -48,7 +48,7 @@ class GameResponse(BaseModel):
     id: UUID
     white_player: PlayerInfo
     black_player: PlayerInfo
-    board: Dict[str, Any]  # Board state (square -> piece)
+    board: Dict[str, Any]  # Board state (occupied square -> piece)
     current_turn: str  # white or black
     status: str
     winner: Optional[PlayerInfo] = None
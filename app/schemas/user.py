@@ -2,7 +2,7 @@
 Pydantic schemas for user-related API endpoints.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from datetime import datetime
 from uuid import UUID
 from typing import Optional
@@ -16,7 +16,15 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     """Schema for user signup."""
-    password: str = Field(..., min_length=8, max_length=100)
+    password: str = Field(..., min_length=8, max_length=72)
+
+    @field_validator("password")
+    @classmethod
+    def password_fits_bcrypt(cls, value: str) -> str:
+        # bcrypt ignores everything past 72 bytes, so reject rather than truncate
+        if len(value.encode("utf-8")) > 72:
+            raise ValueError("Password must be at most 72 bytes")
+        return value
 
 
 class UserLogin(BaseModel):
@@ -4,9 +4,12 @@ Game service layer integrating chess39-core with database and cache.
 
 import sys
 import os
-from typing import Optional
+import math
+from typing import Optional, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add chess39-core to path
 # After restructuring, chess39-core is at root level, not backend/
@@ -17,10 +20,30 @@ from game import Game
 from pieces import PieceType
 from app.db.models import GameModel, Move, User
 from app.schemas.game import MoveResponse
-from app.services.redis_client import cache_game_state, get_cached_game_state, publish_game_update
+from app.services.redis_client import cache_game_state, get_cached_game_state, cache_and_publish_game_update, delete_cached_user
 
 
-def create_game(white_player_id: UUID, black_player_id: UUID, db: Session) -> GameModel:
+# In-process L1 cache in front of Redis (L2) and Postgres (L3) for read paths.
+# The short TTL bounds staleness across workers; write paths always bypass it
+# so moves are never validated against an outdated state.
+# Cached states are shared between requests - treat them as read-only.
+_local_game_states = TTLCache(maxsize=1024, ttl=2)
+
+
+async def _get_game_state(game_id: str, use_local_cache: bool) -> Optional[dict]:
+    """Get game state from the local cache (if allowed) or Redis."""
+    if use_local_cache:
+        state = _local_game_states.get(game_id)
+        if state is not None:
+            return state
+    
+    state = await get_cached_game_state(game_id)
+    if state is not None and use_local_cache:
+        _local_game_states[game_id] = state
+    return state
+
+
+async def create_game(white_player_id: UUID, black_player_id: UUID, db: AsyncSession) -> Tuple[GameModel, dict]:
     """
     Create a new Chess 39 game.
     
@@ -30,7 +53,7 @@ def create_game(white_player_id: UUID, black_player_id: UUID, db: Session) -> Ga
         db: Database session
         
     Returns:
-        Created GameModel instance
+        Tuple of (created GameModel instance, initial game state)
     """
     # Create game object using chess39-core
     game = Game(str(white_player_id), str(black_player_id))
@@ -49,46 +72,57 @@ def create_game(white_player_id: UUID, black_player_id: UUID, db: Session) -> Ga
     )
     
     db.add(db_game)
-    db.commit()
-    db.refresh(db_game)
+    await db.commit()
+    await db.refresh(db_game)
     
     # Cache in Redis
-    cache_game_state(str(db_game.id), initial_state)
+    await cache_game_state(str(db_game.id), initial_state)
     
-    return db_game
+    return db_game, initial_state
 
 
-def load_game(game_id: UUID, db: Session) -> Optional[Game]:
+async def load_game_from_row(db_game: GameModel, use_local_cache: bool = False) -> Game:
     """
-    Load game from cache or database.
+    Build the Game for a database row the caller already holds.
     
-    Returns:
-        Game object from chess39-core or None if not found
+    Prefers the cached state and falls back to the row's own state,
+    so no second database query is needed.
+    
+    Args:
+        db_game: Game database row
+        use_local_cache: Allow the in-process cache (read-only paths only)
     """
-    # Try cache first (hot path)
-    cached = get_cached_game_state(str(game_id))
+    cached = await _get_game_state(str(db_game.id), use_local_cache)
     if cached:
         return Game.from_state(cached)
     
-    # Fallback to database (cold path)
-    db_game = db.query(GameModel).filter(GameModel.id == game_id).first()
-    if not db_game:
-        return None
+    await cache_game_state(str(db_game.id), db_game.current_state_json)
+    return Game.from_state(db_game.current_state_json)
+
+
+async def load_game_with_row(game_id: UUID, db: AsyncSession) -> Tuple[Optional[Game], Optional[GameModel]]:
+    """
+    Load both the Game and its database row with a single query.
+    
+    Use this on write paths that need to update the row afterwards.
     
-    # Load and cache
-    game = Game.from_state(db_game.current_state_json)
-    cache_game_state(str(game_id), db_game.current_state_json)
+    Returns:
+        Tuple of (Game, GameModel), or (None, None) if not found
+    """
+    db_game = await db.get(GameModel, game_id)
+    if not db_game:
+        return None, None
     
-    return game
+    return await load_game_from_row(db_game), db_game
 
 
-def make_move(
+async def make_move(
     game_id: UUID,
     from_square: str,
     to_square: str,
     player_id: UUID,
     promotion_piece: Optional[str],
-    db: Session
+    db: AsyncSession
 ) -> MoveResponse:
     """
     Process a move in a game.
@@ -104,8 +138,8 @@ def make_move(
     Returns:
         MoveResponse with success status and details
     """
-    # Load game
-    game = load_game(game_id, db)
+    # Load game (and the row we update below) in one query
+    game, db_game = await load_game_with_row(game_id, db)
     if not game:
         return MoveResponse(
             success=False,
@@ -119,7 +153,8 @@ def make_move(
         promo_piece_type = PieceType[promotion_piece]
     
     # Attempt move using chess39-core
-    result = game.make_move(from_square, to_square, str(player_id), promo_piece_type)
+    result = game.make_move(from_square, to_square, str(player_id), promo_piece_type,
+                            compute_check=True)
     
     if not result['success']:
         return MoveResponse(
@@ -129,8 +164,6 @@ def make_move(
         )
     
     # Move successful - update database
-    db_game = db.query(GameModel).filter(GameModel.id == game_id).first()
-    
     # Save move to database
     move_record = Move(
         game_id=game_id,
@@ -152,22 +185,23 @@ def make_move(
     db_game.status = game.status
     
     # Handle game completion
+    rated = False
     if game.status in ['checkmate', 'stalemate', 'draw']:
-        db_game.winner_id = UUID(game.winner) if game.winner else None
+        db_game.winner_id = get_winner_id(db_game, game.winner)
         from datetime import datetime
         db_game.completed_at = datetime.utcnow()
         
-        # Update player stats and ELO
+        # Update player stats and ELO (same transaction as the move itself)
         if game.status == 'checkmate':
-            update_elo_ratings(db_game, db)
+            await update_elo_ratings(db_game, db)
+            rated = True
     
-    db.commit()
+    await db.commit()
     
-    # Update cache
-    cache_game_state(str(game_id), new_state)
+    if rated:
+        await delete_cached_players(db_game)
     
-    # Publish update via Redis pub/sub
-    publish_game_update(str(game_id), {
+    await publish_game_update(game_id, new_state, {
         'type': 'move_made',
         'move': {
             'from': from_square,
@@ -187,14 +221,45 @@ def make_move(
     )
 
 
-def update_elo_ratings(game: GameModel, db: Session):
+async def publish_game_update(game_id: UUID, new_state: dict, message: dict):
+    """
+    Push a committed game state to the cache and to subscribers.
+    
+    Also drops this worker's in-process copy so reads see the new state.
+    """
+    # Update cache and publish update via Redis pub/sub (one round-trip)
+    await cache_and_publish_game_update(str(game_id), new_state, message)
+    _local_game_states.pop(str(game_id), None)
+
+
+def get_winner_id(game: GameModel, winner_color: Optional[str]) -> Optional[UUID]:
+    """Map the core engine's winning color ('white'/'black') to that player's user ID."""
+    if winner_color == 'white':
+        return game.white_player_id
+    if winner_color == 'black':
+        return game.black_player_id
+    return None
+
+
+async def update_elo_ratings(game: GameModel, db: AsyncSession):
     """
     Update ELO ratings for both players after game completion.
     
     Uses standard ELO formula with K-factor of 32.
+    Does not commit - the caller commits it together with the game result,
+    then calls delete_cached_players().
     """
-    white = db.query(User).filter(User.id == game.white_player_id).first()
-    black = db.query(User).filter(User.id == game.black_player_id).first()
+    # One SELECT for both players, locking the rows (in ID order) until commit
+    result = await db.scalars(
+        select(User)
+        .where(User.id.in_([game.white_player_id, game.black_player_id]))
+        .order_by(User.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    players = {user.id: user for user in result}
+    white = players[game.white_player_id]
+    black = players[game.black_player_id]
     
     # Determine outcome (1 = white wins, 0 = black wins, 0.5 = draw)
     if game.winner_id == game.white_player_id:
@@ -213,9 +278,9 @@ def update_elo_ratings(game: GameModel, db: Session):
         white.draws += 1
         black.draws += 1
     
-    # Calculate expected scores
-    white_expected = 1 / (1 + 10 ** ((black.elo_rating - white.elo_rating) / 400))
-    black_expected = 1 / (1 + 10 ** ((white.elo_rating - black.elo_rating) / 400))
+    # Calculate expected scores (they always sum to 1, so one exponentiation is enough)
+    white_expected = 1.0 / (1.0 + math.pow(10.0, (black.elo_rating - white.elo_rating) / 400.0))
+    black_expected = 1.0 - white_expected
     
     # Update ratings (K = 32)
     K = 32
@@ -225,5 +290,9 @@ def update_elo_ratings(game: GameModel, db: Session):
     # Update game counts
     white.games_played += 1
     black.games_played += 1
-    
-    db.commit()
+
+
+async def delete_cached_players(game: GameModel):
+    """Drop both players' cached profiles after their stats were committed."""
+    await delete_cached_user(str(game.white_player_id))
+    await delete_cached_user(str(game.black_player_id))
@@ -2,20 +2,27 @@
 Redis client for caching and pub/sub.
 """
 
-import redis
-import json
+import redis.asyncio as redis
+import orjson
 from typing import Optional, Any
 from ..core.config import settings
 
 
-# Create Redis client
-redis_client = redis.from_url(
+# Shared connection pool (one per worker process). Each game subscription
+# holds a connection while it is open, so when the pool is exhausted callers
+# wait up to REDIS_POOL_TIMEOUT seconds for one instead of failing at once.
+redis_pool = redis.BlockingConnectionPool.from_url(
     settings.REDIS_URL,
-    decode_responses=True  # Automatically decode bytes to strings
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT
+    # Values stay as bytes: orjson encodes to and decodes from bytes directly
 )
 
+# Create Redis client (async - never blocks the event loop)
+redis_client = redis.Redis(connection_pool=redis_pool)
 
-def cache_game_state(game_id: str, game_state: dict, ttl: int = 86400):
+
+async def cache_game_state(game_id: str, game_state: dict, ttl: int = 86400):
     """
     Cache game state in Redis.
     
@@ -25,10 +32,10 @@ def cache_game_state(game_id: str, game_state: dict, ttl: int = 86400):
         ttl: Time to live in seconds (default: 24 hours)
     """
     key = f"game:{game_id}"
-    redis_client.setex(key, ttl, json.dumps(game_state))
+    await redis_client.setex(key, ttl, orjson.dumps(game_state))
 
 
-def get_cached_game_state(game_id: str) -> Optional[dict]:
+async def get_cached_game_state(game_id: str) -> Optional[dict]:
     """
     Get cached game state from Redis.
     
@@ -36,17 +43,48 @@ def get_cached_game_state(game_id: str) -> Optional[dict]:
         Game state dict or None if not cached
     """
     key = f"game:{game_id}"
-    data = redis_client.get(key)
-    return json.loads(data) if data else None
+    data = await redis_client.get(key)
+    return orjson.loads(data) if data else None
 
 
-def delete_cached_game(game_id: str):
+async def delete_cached_game(game_id: str):
     """Delete game from cache."""
     key = f"game:{game_id}"
-    redis_client.delete(key)
+    await redis_client.delete(key)
+
+
+async def cache_user(user_id: str, user_data: dict, ttl: int = 60):
+    """
+    Cache a user's profile in Redis.
+    
+    Args:
+        user_id: User ID
+        user_data: JSON-compatible user dictionary (never includes the password hash)
+        ttl: Time to live in seconds (default: 60 seconds, bounds staleness)
+    """
+    key = f"user:{user_id}"
+    await redis_client.setex(key, ttl, orjson.dumps(user_data))
+
+
+async def get_cached_user(user_id: str) -> Optional[dict]:
+    """
+    Get cached user profile from Redis.
+    
+    Returns:
+        User dict or None if not cached
+    """
+    key = f"user:{user_id}"
+    data = await redis_client.get(key)
+    return orjson.loads(data) if data else None
 
 
-def publish_game_update(game_id: str, message: dict):
+async def delete_cached_user(user_id: str):
+    """Delete user from cache (call after any write to the user row)."""
+    key = f"user:{user_id}"
+    await redis_client.delete(key)
+
+
+async def publish_game_update(game_id: str, message: dict):
     """
     Publish game update to Redis pub/sub channel.
     
@@ -55,10 +93,27 @@ def publish_game_update(game_id: str, message: dict):
         message: Message dictionary to broadcast
     """
     channel = f"game:{game_id}"
-    redis_client.publish(channel, json.dumps(message))
+    await redis_client.publish(channel, orjson.dumps(message))
+
+
+async def cache_and_publish_game_update(game_id: str, game_state: dict, message: dict, ttl: int = 86400):
+    """
+    Cache game state and publish an update in a single round-trip.
+    
+    Args:
+        game_id: Game ID
+        game_state: Game state dictionary
+        message: Message dictionary to broadcast
+        ttl: Time to live in seconds (default: 24 hours)
+    """
+    key = f"game:{game_id}"
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.setex(key, ttl, orjson.dumps(game_state))
+        pipe.publish(key, orjson.dumps(message))
+        await pipe.execute()
 
 
-def subscribe_to_game(game_id: str):
+async def subscribe_to_game(game_id: str):
     """
     Subscribe to game updates channel.
     
@@ -67,5 +122,5 @@ def subscribe_to_game(game_id: str):
     """
     pubsub = redis_client.pubsub()
     channel = f"game:{game_id}"
-    pubsub.subscribe(channel)
+    await pubsub.subscribe(channel)
     return pubsub
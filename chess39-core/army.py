@@ -1,4 +1,5 @@
 import random
+from typing import List, NamedTuple, Tuple
 
 # Handle imports - work both standalone and when imported
 try:
@@ -9,6 +10,7 @@ except ImportError:
 # --- Configuration from our project plan ---
 TARGET_POINTS = 39  # 
 MAX_PAWNS = 8       # Implied by 
+MAX_MAJORS = 7      # Back-rank squares left once the King is placed
 
 # List of "major" pieces we can pick from.
 # We exclude PAWN (handled last) and KING (not counted in points [cite: 65]).
@@ -19,64 +21,83 @@ MAJOR_PIECES = [
     PieceType.KNIGHT
 ]
 
-def generate_random_army():
+class Army(NamedTuple):
     """
-    Generates a random list of PieceType members that
-    sum exactly to TARGET_POINTS, respecting constraints.
+    A generated army, already split the way the board places it:
+    the major pieces (back rank) and how many pawns (pawn rank).
+    The King is always present, so it is not stored.
+    """
+    majors: Tuple[PieceType, ...]
+    pawn_count: int
+
+    def as_list(self) -> List[PieceType]:
+        """The army as a flat list of pieces: majors, pawns, then the King."""
+        return list(self.majors) + [PieceType.PAWN] * self.pawn_count + [PieceType.KING]
+
 
-    This logic uses the "Top-Down, Fill & Retry" strategy.
-    It picks major pieces randomly, then fills the remainder
-    with pawns. If the pawn count is invalid, it retries.
+def _build_valid_armies():
     """
+    Lists every army that sums exactly to TARGET_POINTS with at most
+    MAX_PAWNS pawns and MAX_MAJORS major pieces, i.e. every army that
+    fits on the board.
 
-    # We start an infinite loop that we will 'break' out of
-    # once we have a valid army.
-    while True:
-        army = []
-        remaining_points = TARGET_POINTS
+    There are only a few hundred of these, so we build them all once
+    (when the module is imported) instead of searching at random
+    every time we need an army.
+    """
+    armies = []
 
-        # We shuffle the list so we don't always
-        # pick Queens first. This gives more random armies.
-        random.shuffle(MAJOR_PIECES)
+    queen, rook, bishop, knight = (PieceType.QUEEN, PieceType.ROOK,
+                                   PieceType.BISHOP, PieceType.KNIGHT)
 
-        for piece in MAJOR_PIECES:
-            # How many *could* we add?
-            # e.g., 39 remaining // 9 (Queen) = 4 max
-            max_possible = remaining_points // piece.value
+    for num_queens in range(TARGET_POINTS // queen.points + 1):
+        after_queens = TARGET_POINTS - num_queens * queen.points
 
-            # How many *will* we add? (from 0 to max_possible)
-            num_to_add = random.randint(0, max_possible)
+        for num_rooks in range(after_queens // rook.points + 1):
+            after_rooks = after_queens - num_rooks * rook.points
 
-            # Add them to the army
-            army.extend([piece] * num_to_add)
+            for num_bishops in range(after_rooks // bishop.points + 1):
+                after_bishops = after_rooks - num_bishops * bishop.points
 
-            # Update our remaining "budget"
-            remaining_points -= num_to_add * piece.value
+                for num_knights in range(after_bishops // knight.points + 1):
+                    # Whatever is left MUST be filled by pawns (PAWN.points is 1)
+                    num_pawns = after_bishops - num_knights * knight.points
 
-        # At this point, `remaining_points` MUST be filled by pawns,
-        # since PAWN.value is 1.
-        num_pawns = remaining_points
+                    # Too many pawns? Then this combination is not allowed.
+                    if num_pawns > MAX_PAWNS:
+                        continue
 
-        # --- Validation Step ---
-        # Did we need too many pawns?
-        if num_pawns <= MAX_PAWNS:
-            # No, this is a valid army!
-            army.extend([PieceType.PAWN] * num_pawns)
+                    # More majors than back-rank squares? Same again.
+                    if num_queens + num_rooks + num_bishops + num_knights > MAX_MAJORS:
+                        continue
 
-            # Break the 'while True' loop, we are done!
-            break
-        else:
-            # Yes, we needed (e.g.) 10 pawns. This is invalid.
-            # The 'while True' loop will simply run again
-            # from the top, trying a new random combination.
-            pass
+                    # The King is *always* present but
+                    # not counted in the 39 points[cite: 55, 65].
+                    armies.append(Army(
+                        majors=(queen,) * num_queens
+                        + (rook,) * num_rooks
+                        + (bishop,) * num_bishops
+                        + (knight,) * num_knights,
+                        pawn_count=num_pawns,
+                    ))
 
-    # Finally, don't forget the King!
-    # The plan says the King is *always* present but
-    # not counted in the 39 points[cite: 55, 65].
-    army.append(PieceType.KING)
+    return armies
 
-    return army
+
+# Every valid army, computed once at import time
+_VALID_ARMIES = _build_valid_armies()
+
+
+def generate_random_army() -> Army:
+    """
+    Generates a random Army whose pieces sum exactly
+    to TARGET_POINTS, respecting constraints.
+
+    Every valid army is already listed in _VALID_ARMIES,
+    so we just pick one of them - no retry loop needed.
+    Use Army.as_list() when a flat list of pieces is needed.
+    """
+    return random.choice(_VALID_ARMIES)
 
 # --- Test Block ---
 # This code only runs when you run this file directly
@@ -85,7 +106,7 @@ if __name__ == "__main__":
 
     for i in range(5): # Generate 5 test armies
         print(f"\n--- Test Army {i+1} ---")
-        new_army = generate_random_army()
+        new_army = generate_random_army().as_list()
 
         total_value = 0
         piece_counts = {}
@@ -93,7 +114,7 @@ if __name__ == "__main__":
         print(f"Generated Army (pieces): {[piece.name for piece in new_army]}")
 
         for piece in new_army:
-            total_value += piece.value
+            total_value += piece.points
 
             # Count the pieces for our summary
             piece_counts[piece.name] = piece_counts.get(piece.name, 0) + 1
@@ -1,20 +1,40 @@
 import random
+from types import MappingProxyType
 
 # Handle imports - work both standalone and when imported
 try:
-    from pieces import PieceType
+    from pieces import PieceType, SQUARE_INDEX
     from army import generate_random_army
 except ImportError:
-    from .pieces import PieceType
+    from .pieces import PieceType, SQUARE_INDEX
     from .army import generate_random_army
 
-PIECE_SYMBOLS = {
+PIECE_SYMBOLS = MappingProxyType({
     PieceType.PAWN: "P",
     PieceType.KNIGHT: "N",
     PieceType.BISHOP: "B",
     PieceType.ROOK: "R",
     PieceType.QUEEN: "Q",
     PieceType.KING: "K",
+})
+
+# What print_board shows for each square: white as uppercase,
+# black as lowercase and "." for an empty square.
+PIECE_DISPLAY = MappingProxyType({
+    **{(piece_type, "white"): symbol.upper() for piece_type, symbol in PIECE_SYMBOLS.items()},
+    **{(piece_type, "black"): symbol.lower() for piece_type, symbol in PIECE_SYMBOLS.items()},
+    None: ".",
+})
+
+# Starting squares for each side, built once instead of on every place_army.
+# Stored right-to-left (h..a) so pop() hands them out left-to-right.
+_BACK_RANK = {
+    "white": [0 * 8 + col for col in range(7, -1, -1)],
+    "black": [7 * 8 + col for col in range(7, -1, -1)],
+}
+_PAWN_RANK = {
+    "white": [1 * 8 + col for col in range(7, -1, -1)],
+    "black": [6 * 8 + col for col in range(7, -1, -1)],
 }
 
 class Board:
@@ -22,23 +42,80 @@ class Board:
         Represents the Chess 39 board and game state.
     """
 
+    # One Board per live game, so skip the per-instance __dict__
+    __slots__ = ("grid", "occ", "by_color", "by_piece")
+
     def __init__(self):
         self.grid = self._create_empty_grid()
 
+        # Bitboards kept in sync with the grid: bit (row * 8 + col) is set
+        # when that square holds a piece. Only change squares through
+        # set_piece() / clear_square() / load_grid() so these stay correct.
+        self.occ = 0  # Every occupied square
+        self.by_color = {"white": 0, "black": 0}  # Squares holding each color's pieces
+        self.by_piece = {piece_type: 0 for piece_type in PieceType}  # Both colors
+
     def _create_empty_grid(self):
         """
-            A helper method to generate our dictionary of 64 squares.
+            A helper method to generate our flat list of 64 squares.
+            Square (col, row) lives at index row * 8 + col (see pieces.SQUARE_NAMES).
+        """
+        return [None] * 64  # No piece on any square initially
+
+    def set_piece(self, index, piece_data):
+        """
+            Puts piece_data ((PieceType, "color") or None) on the square at index,
+            replacing whatever was there, and updates the bitboards.
         """
-        grid = {}
-        cols = 'abcdefgh'
-        rows = '12345678'
+        bit = 1 << index
+
+        old_piece = self.grid[index]
+        if old_piece is not None:
+            self.occ &= ~bit
+            self.by_color[old_piece[1]] &= ~bit
+            self.by_piece[old_piece[0]] &= ~bit
+
+        self.grid[index] = piece_data
+        if piece_data is not None:
+            self.occ |= bit
+            self.by_color[piece_data[1]] |= bit
+            self.by_piece[piece_data[0]] |= bit
 
-        for col in cols:
-            for row in rows:
-                square_name = f"{col}{row}"
-                grid[square_name] = None  # No piece on the square initially
+    def clear_square(self, index):
+        """
+            Removes whatever piece is on the square at index.
+        """
+        self.set_piece(index, None)
 
-        return grid
+    def load_grid(self, grid):
+        """
+            Replaces the whole board with grid (64 entries of (PieceType, "color")
+            or None) and rebuilds the bitboards in a single pass.
+        """
+        occ = 0
+        by_color = {"white": 0, "black": 0}
+        by_piece = {piece_type: 0 for piece_type in PieceType}
+        for index, piece_data in enumerate(grid):
+            if piece_data is not None:
+                bit = 1 << index
+                occ |= bit
+                by_color[piece_data[1]] |= bit
+                by_piece[piece_data[0]] |= bit
+
+        self.grid = list(grid)
+        self.occ = occ
+        self.by_color = by_color
+        self.by_piece = by_piece
+
+    def king_square(self, color):
+        """
+            Returns the index of the given color's king, or None if it has no king.
+            Read straight from the bitboards, so there is no board scan.
+        """
+        kings = self.by_piece[PieceType.KING] & self.by_color[color]
+        if not kings:
+            return None
+        return (kings & -kings).bit_length() - 1
 
     def setup_board(self):
         """
@@ -53,33 +130,30 @@ class Board:
 
 
         """
-            Places the given army on the board for the specified color.
+            Places the given army (see army.Army) on the board for the specified color.
         """
         # Determine which ranks to use based on color
-        rank_1 = "1" if is_white else "8" # Back rank
-        rank_2 = "2" if is_white else "7" # Pawn rank
+        color = "white" if is_white else "black"
+        rank_1_squares = _BACK_RANK[color].copy() # Back rank
+        rank_2_squares = _PAWN_RANK[color].copy() # Pawn rank
 
-        rank_1_squares = [f"{col}{rank_1}" for col in 'abcdefgh']
-        rank_2_squares = [f"{col}{rank_2}" for col in 'abcdefgh']
-
-        king = army.pop(army.index(PieceType.KING))
+        # The King goes on a random back-rank square [cite: 70]
         king_square = random.choice(rank_1_squares)
-
-        self.grid[king_square] = (king, 'white' if is_white else 'black')
+        self.set_piece(king_square, (PieceType.KING, color))
         rank_1_squares.remove(king_square)
 
-        army.sort(key=lambda piece: piece == PieceType.PAWN, reverse=True)
+        # Pawns fill the pawn rank "left-to-right"
+        for _ in range(min(army.pawn_count, len(rank_2_squares))):
+            self.set_piece(rank_2_squares.pop(), (PieceType.PAWN, color))
 
-        for piece in army:
-            if piece == PieceType.PAWN:
-                if rank_2_squares: # Make sure there is space
-                    pawn_square = rank_2_squares.pop(0) # "left-to-right"
-                    self.grid[pawn_square] = (piece, "white" if is_white else "black")
-            else:
-                    # 3. Place remaining pieces (Rule [cite: 70])
-                if rank_1_squares: # Make sure there is space
-                    piece_square = rank_1_squares.pop(0)
-                    self.grid[piece_square] = (piece, "white" if is_white else "black")
+        # 3. Place remaining pieces (Rule [cite: 70]) in a random order, so
+        # the back rank isn't laid out the same way every game
+        majors = list(army.majors)
+        random.shuffle(majors)
+        for piece in majors:
+            if not rank_1_squares: # Make sure there is space
+                break
+            self.set_piece(rank_1_squares.pop(), (piece, color))
 
     def print_board(self):
         """
@@ -88,19 +162,11 @@ class Board:
         """
         print("\n--- Chess 39 Board ---")
         # We loop from 8 *down to* 1
-        for row in "87654321":
-            row_str = f"{row} | "
-            for col in "abcdefgh":
-                square = f"{col}{row}"
-                piece_data = self.grid[square] # This will be None or (PieceType, "color")
-
-                if piece_data is None:
-                    row_str += ". "
-                else:
-                    piece_type, color = piece_data
-                    symbol = PIECE_SYMBOLS[piece_type]
-                    # Show white as uppercase, black as lowercase
-                    row_str += f"{symbol.upper() if color == 'white' else symbol.lower()} "
+        for row in range(7, -1, -1):
+            row_str = f"{row + 1} | "
+            for col in range(8):
+                piece_data = self.grid[row * 8 + col] # This will be None or (PieceType, "color")
+                row_str += f"{PIECE_DISPLAY[piece_data]} "
 
             print(row_str)
 
@@ -114,14 +180,14 @@ if __name__ == "__main__":
     board = Board()
     board.print_board()
     board.setup_board()
-    board.grid["f3"] = (PieceType.QUEEN, "white")
+    board.set_piece(SQUARE_INDEX["f3"], (PieceType.QUEEN, "white"))
     board.print_board()
     print({"a":2,"b":3})
     
 
-    print("\n--- Testing the Grid (Dictionary) ---")
-    print(f"Piece at e1: {board.grid['e1']}")
-    print(f"Piece at d7: {board.grid['d7']}")
-    print(f"Piece at a4 ()): {board.grid['a4']}")
+    print("\n--- Testing the Grid (List) ---")
+    print(f"Piece at e1: {board.grid[SQUARE_INDEX['e1']]}")
+    print(f"Piece at d7: {board.grid[SQUARE_INDEX['d7']]}")
+    print(f"Piece at a4 ()): {board.grid[SQUARE_INDEX['a4']]}")
             
 
@@ -5,29 +5,74 @@ Provides functionality to convert board states to/from FEN notation
 to enable game state persistence andreplay.
 """
 
-from typing import Dict, Tuple
-from .pieces import PieceType
+import re
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
+# Handle imports - work both standalone and when imported
+try:
+    from pieces import PieceType
+except ImportError:
+    from .pieces import PieceType
 
-PIECE_TO_FEN = {
+
+# The lookup tables below are read-only views (MappingProxyType) so callers
+# can't change them by accident. The hot loops read the private dicts behind
+# them, which is a little faster than going through the proxy.
+PIECE_TO_FEN = MappingProxyType({
     PieceType.PAWN: 'p',
     PieceType.KNIGHT: 'n',
     PieceType.BISHOP: 'b',
     PieceType.ROOK: 'r',
     PieceType.QUEEN: 'q',
     PieceType.KING: 'k',
+})
+
+FEN_TO_PIECE = MappingProxyType({v: k for k, v in PIECE_TO_FEN.items()})
+
+# One lookup per square: (piece_type, color) <-> FEN character.
+# White pieces are uppercase, black pieces are lowercase.
+_PIECE_CHAR = {
+    **{(piece_type, 'white'): char.upper() for piece_type, char in PIECE_TO_FEN.items()},
+    **{(piece_type, 'black'): char for piece_type, char in PIECE_TO_FEN.items()},
 }
+PIECE_CHAR = MappingProxyType(_PIECE_CHAR)
+
+FEN_CHAR_TO_PIECE = MappingProxyType({char: piece_data for piece_data, char in _PIECE_CHAR.items()})
 
-FEN_TO_PIECE = {v: k for k, v in PIECE_TO_FEN.items()}
+# FEN parsing table indexed by byte value: a digit maps to the number of
+# empty squares it skips, a piece letter maps to its (piece_type, color)
+# and anything else is None (not valid in the piece placement field).
+_FEN_TABLE = [None] * 256
+for _byte in b'12345678':
+    _FEN_TABLE[_byte] = _byte - ord('0')
+for _char, _piece_data in FEN_CHAR_TO_PIECE.items():
+    _FEN_TABLE[ord(_char)] = _piece_data
+del _byte, _char, _piece_data
 
+# A whole FEN record, validated and split in one regex pass: piece placement
+# (8 ranks), active color, castling, en passant, then the optional halfmove
+# clock and fullmove number.
+_FEN_RE = re.compile(
+    r'\s*((?:[1-8pnbrqkPNBRQK]{1,8}/){7}[1-8pnbrqkPNBRQK]{1,8})'
+    r'\s+([wb])'
+    r'\s+(-|[KQkq]{1,4})'
+    r'\s+(-|[a-h][36])'
+    r'(?:\s+(\d+))?'
+    r'(?:\s+(\d+))?\s*'
+)
 
-def board_to_fen(grid: Dict, current_turn: str, castling_rights: Dict, 
+# Empty-square counts as strings, so we don't call str() for every gap
+DIGIT_STR = ('0', '1', '2', '3', '4', '5', '6', '7', '8')
+
+
+def board_to_fen(grid: List, current_turn: str, castling_rights: Dict, 
                  en_passant_target: str, halfmove_clock: int, fullmove_number: int) -> str:
     """
     Convert a Chess 39 board state to FEN notation.
     
     Args:
-        grid: Board grid dictionary
+        grid: Board grid (flat list of 64 squares, index = row * 8 + col)
         current_turn: 'white' or 'black'
         castling_rights: Dict with castling availability
         en_passant_target: Square where en passant is possible (or None)
@@ -38,32 +83,31 @@ def board_to_fen(grid: Dict, current_turn: str, castling_rights: Dict,
         FEN string representing the position
     """
     # 1. Piece placement
+    # (tables bound to locals: the loop below runs once per square)
+    piece_char = _PIECE_CHAR
+    digit_str = DIGIT_STR
     fen_rows = []
     for row in range(7, -1, -1):  # Start from rank 8
-        fen_row = ""
+        parts = []
         empty_count = 0
+        base = row * 8
         
         for col in range(8):
-            square = chr(ord('a') + col) + str(row + 1)
-            piece_data = grid.get(square)
+            piece_data = grid[base + col]
             
             if piece_data is None:
                 empty_count += 1
             else:
                 if empty_count > 0:
-                    fen_row += str(empty_count)
+                    parts.append(digit_str[empty_count])
                     empty_count = 0
                 
-                piece_type, color = piece_data
-                piece_char = PIECE_TO_FEN[piece_type]
-                if color == 'white':
-                    piece_char = piece_char.upper()
-                fen_row += piece_char
+                parts.append(piece_char[piece_data])
         
         if empty_count > 0:
-            fen_row += str(empty_count)
+            parts.append(digit_str[empty_count])
         
-        fen_rows.append(fen_row)
+        fen_rows.append(''.join(parts))
     
     position = '/'.join(fen_rows)
     
@@ -95,59 +139,70 @@ def board_to_fen(grid: Dict, current_turn: str, castling_rights: Dict,
     return f"{position} {active_color} {castling} {en_passant} {halfmove} {fullmove}"
 
 
-def fen_to_board(fen: str) -> Tuple[Dict, str, Dict, str, int, int]:
+def fen_to_board(fen: str) -> Tuple[List, str, Dict, str, int, int]:
     """
     Parse a FEN string and return board state components.
     
     Returns:
         Tuple of (grid, current_turn, castling_rights, en_passant_target, halfmove_clock, fullmove_number)
+        
+    Raises:
+        ValueError: If the string is not a well-formed FEN record
     """
-    parts = fen.split()
+    match = _FEN_RE.fullmatch(fen)
+    if match is None:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+    placement, active_color, castling, en_passant, halfmove, fullmove = match.groups()
     
     # 1. Parse piece placement
-    grid = {f"{chr(ord('a') + col)}{row + 1}": None for col in range(8) for row in range(8)}
+    grid = [None] * 64
+    fen_table = _FEN_TABLE
     
-    rows = parts[0].split('/')
+    rows = placement.encode('ascii').split(b'/')
     for row_idx, row_fen in enumerate(rows):
-        row = 7 - row_idx  # FEN starts from rank 8
-        col = 0
+        square = (7 - row_idx) * 8  # FEN starts from rank 8
+        row_end = square + 8
         
-        for char in row_fen:
-            if char.isdigit():
-                col += int(char)
+        # One table lookup per byte instead of isdigit()/isupper()/lower().
+        # The regex has already rejected any byte that is not in the table,
+        # but not ranks that describe more or fewer than 8 squares.
+        for byte in row_fen:
+            entry = fen_table[byte]
+            if entry.__class__ is int:
+                square += entry
+            elif square < row_end:
+                grid[square] = entry
+                square += 1
             else:
-                piece_char = char.lower()
-                piece_type = FEN_TO_PIECE.get(piece_char)
-                color = 'white' if char.isupper() else 'black'
-                
-                square = chr(ord('a') + col) + str(row + 1)
-                grid[square] = (piece_type, color)
-                col += 1
+                square += 1  # A piece past the end of the rank
+                break
+        if square != row_end:
+            raise ValueError(f"FEN rank {8 - row_idx} does not describe 8 squares: {row_fen.decode()!r}")
     
     # 2. Active color
-    current_turn = 'white' if parts[1] == 'w' else 'black'
+    current_turn = 'white' if active_color == 'w' else 'black'
     
     # 3. Castling availability
     castling_rights = {
         'white': {'kingside': False, 'queenside': False},
         'black': {'kingside': False, 'queenside': False}
     }
-    if 'K' in parts[2]:
+    if 'K' in castling:
         castling_rights['white']['kingside'] = True
-    if 'Q' in parts[2]:
+    if 'Q' in castling:
         castling_rights['white']['queenside'] = True
-    if 'k' in parts[2]:
+    if 'k' in castling:
         castling_rights['black']['kingside'] = True
-    if 'q' in parts[2]:
+    if 'q' in castling:
         castling_rights['black']['queenside'] = True
     
     # 4. En passant target
-    en_passant_target = parts[3] if parts[3] != '-' else None
+    en_passant_target = en_passant if en_passant != '-' else None
     
     # 5. Halfmove clock
-    halfmove_clock = int(parts[4]) if len(parts) > 4 else 0
+    halfmove_clock = int(halfmove) if halfmove is not None else 0
     
     # 6. Fullmove number
-    fullmove_number = int(parts[5]) if len(parts) > 5 else 1
+    fullmove_number = int(fullmove) if fullmove is not None else 1
     
     return grid, current_turn, castling_rights, en_passant_target, halfmove_clock, fullmove_number
@@ -6,22 +6,31 @@ move validation, and win conditions for Chess 39.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, List, Any, Tuple
-import copy
+from typing import Optional, Dict, List, Any, Tuple, Iterator
 
 # Handle imports - work both standalone and when imported
 try:
-    from pieces import PieceType, get_piece_directions, KNIGHT_MOVES, KING_MOVES
+    from pieces import PieceType, get_piece_directions, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSH, PAWN_DOUBLE, SQUARE_NAMES, SQUARE_INDEX, ROOK_DIRECTIONS, BISHOP_DIRECTIONS, BETWEEN
     from board import Board
 except ImportError:
-    from .pieces import PieceType, get_piece_directions, KNIGHT_MOVES, KING_MOVES
+    from .pieces import PieceType, get_piece_directions, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSH, PAWN_DOUBLE, SQUARE_NAMES, SQUARE_INDEX, ROOK_DIRECTIONS, BISHOP_DIRECTIONS, BETWEEN
     from .board import Board
 
+# PieceType by name, for turning serialized boards back into pieces
+_NAME_TO_PIECE_TYPE = {piece_type.name: piece_type for piece_type in PieceType}
+
 class Game:
     """
     High-level game controller that manages game state and validates moves.
     """
 
+    # The server keeps many games alive at once, so skip the per-instance __dict__
+    __slots__ = (
+        'board', 'white_player_id', 'black_player_id', 'current_turn',
+        'move_history', 'status', 'winner', 'castling_rights',
+        'en_passant_target', 'halfmove_clock', 'fullmove_number', '_board_state',
+    )
+
     def __init__(self, white_player_id: str, black_player_id: str):
         self.board = Board()
         self.white_player_id = white_player_id
@@ -38,11 +47,16 @@ class Game:
         self.halfmove_clock = 0  # Moves since last capture or pawn move (for 50-move rule)
         self.fullmove_number = 1
 
+        # Serialized board for get_state(), rebuilt only after the board changes
+        self._board_state = None
+
     def start_game(self):
         """Initialize board with random Chess 39 armies."""
         self.board.setup_board()
+        self._board_state = None
 
-    def make_move(self, from_sq: str, to_sq: str, player_id: str, promotion_piece: Optional[PieceType] = None) -> dict:
+    def make_move(self, from_sq: str, to_sq: str, player_id: str, promotion_piece: Optional[PieceType] = None,
+                  compute_check: bool = False) -> dict:
         """
         Validate and execute a move.
         
@@ -51,9 +65,11 @@ class Game:
             to_sq: Destination square (e.g., 'e4')
             player_id: ID of the player making the move
             promotion_piece: Piece type to promote to (if pawn reaches end rank)
+            compute_check: Also report whether the side to move is now in check
             
         Returns:
-            dict with 'success' bool and 'message' string
+            dict with 'success' bool and 'message' string ('is_check' is
+            only included when compute_check is set)
         """
         # Verify it's the player's turn
         if (self.current_turn == 'white' and player_id != self.white_player_id) or \
@@ -64,8 +80,15 @@ class Game:
         if self.status != 'ongoing':
             return {'success': False, 'message': f'Game is {self.status}'}
 
+        # Reject squares that are not on the board. From here on every
+        # helper works with grid indices (row * 8 + col), not square names.
+        from_index = SQUARE_INDEX.get(from_sq)
+        to_index = SQUARE_INDEX.get(to_sq)
+        if from_index is None or to_index is None:
+            return {'success': False, 'message': 'Invalid square'}
+
         # Get piece at from_sq
-        piece_data = self.board.grid.get(from_sq)
+        piece_data = self.board.grid[from_index]
         if not piece_data:
             return {'success': False, 'message': 'No piece at source square'}
 
@@ -76,15 +99,15 @@ class Game:
             return {'success': False, 'message': 'Cannot move opponent\'s piece'}
 
         # Validate the move
-        if not self._is_valid_move(from_sq, to_sq, piece_type, piece_color):
+        if not self._is_valid_move(from_index, to_index, piece_type, piece_color):
             return {'success': False, 'message': 'Invalid move'}
 
         # Check if move would leave king in check
-        if self._would_be_in_check_after_move(from_sq, to_sq, piece_color):
+        if self._would_be_in_check_after_move(from_index, to_index, piece_color):
             return {'success': False, 'message': 'Move would leave king in check'}
 
         # Execute the move
-        captured_piece = self._execute_move(from_sq, to_sq, piece_type, piece_color, promotion_piece)
+        captured_piece = self._execute_move(from_index, to_index, piece_type, piece_color, promotion_piece)
 
         # Record move in history
         self.move_history.append({
@@ -103,92 +126,66 @@ class Game:
         # Check for game over conditions
         self._check_game_over()
 
-        return {
+        result = {
             'success': True,
             'message': 'Move successful',
             'captured': captured_piece.name if captured_piece else None,
-            'is_check': self.is_in_check(self.current_turn),
             'status': self.status
         }
+        if compute_check:
+            result['is_check'] = self.is_in_check(self.current_turn)
+        return result
 
-    def _is_valid_move(self, from_sq: str, to_sq: str, piece_type: PieceType, piece_color: str) -> bool:
-        """Check if a move is valid according to chess rules."""
-        if from_sq == to_sq:
-            return False
-
-        # Get square coordinates
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
-        # Check if destination is off board
-        if not (0 <= to_col < 8 and 0 <= to_row < 8):
+    def _is_valid_move(self, from_index: int, to_index: int, piece_type: PieceType, piece_color: str) -> bool:
+        """Check if a move (between grid indices) is valid according to chess rules."""
+        if from_index == to_index:
             return False
 
         # Check if destination has same color piece
-        dest_piece = self.board.grid.get(to_sq)
+        dest_piece = self.board.grid[to_index]
         if dest_piece and dest_piece[1] == piece_color:
             return False
 
-        # Piece-specific move validation
-        if piece_type == PieceType.PAWN:
-            return self._is_valid_pawn_move(from_sq, to_sq, piece_color)
-        elif piece_type == PieceType.KNIGHT:
-            return self._is_valid_knight_move(from_sq, to_sq)
-        elif piece_type == PieceType.BISHOP:
-            return self._is_valid_bishop_move(from_sq, to_sq)
-        elif piece_type == PieceType.ROOK:
-            return self._is_valid_rook_move(from_sq, to_sq)
-        elif piece_type == PieceType.QUEEN:
-            return self._is_valid_queen_move(from_sq, to_sq)
-        elif piece_type == PieceType.KING:
-            return self._is_valid_king_move(from_sq, to_sq, piece_color)
-
-        return False
+        # Piece-specific move validation (see _VALIDATORS below)
+        validator = self._VALIDATORS.get(piece_type)
+        if validator is None:
+            return False
+        return validator(self, from_index, to_index, piece_color)
 
-    def _is_valid_pawn_move(self, from_sq: str, to_sq: str, color: str) -> bool:
+    def _is_valid_pawn_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate pawn moves (forward, double-forward, captures, en passant)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
-        direction = 1 if color == 'white' else -1
-        start_row = 1 if color == 'white' else 6
-
-        dest_piece = self.board.grid.get(to_sq)
+        to_bit = 1 << to_index
+        occ = self.board.occ
 
         # Forward move (one square)
-        if from_col == to_col and to_row == from_row + direction:
-            return dest_piece is None
+        push = PAWN_PUSH[color][from_index]
+        if to_bit == push:
+            return not occ & to_bit
 
         # Double forward move (from starting position)
-        if from_col == to_col and from_row == start_row and to_row == from_row + 2 * direction:
-            middle_sq = self._coords_to_square(from_col, from_row + direction)
-            return dest_piece is None and self.board.grid.get(middle_sq) is None
+        if to_bit == PAWN_DOUBLE[color][from_index]:
+            return not occ & (push | to_bit)
 
         # Diagonal capture
-        if abs(to_col - from_col) == 1 and to_row == from_row + direction:
+        if PAWN_ATTACKS[color][from_index] & to_bit:
             # Normal capture
+            dest_piece = self.board.grid[to_index]
             if dest_piece and dest_piece[1] != color:
                 return True
             # En passant
-            if to_sq == self.en_passant_target:
+            if SQUARE_NAMES[to_index] == self.en_passant_target:
                 return True
 
         return False
 
-    def _is_valid_knight_move(self, from_sq: str, to_sq: str) -> bool:
+    def _is_valid_knight_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate knight moves (L-shape)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
-        diff_col = to_col - from_col
-        diff_row = to_row - from_row
+        return (KNIGHT_ATTACKS[from_index] >> to_index) & 1 == 1
 
-        return (diff_col, diff_row) in KNIGHT_MOVES
-
-    def _is_valid_bishop_move(self, from_sq: str, to_sq: str) -> bool:
+    def _is_valid_bishop_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate bishop moves (diagonal)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
+        from_col, from_row = from_index % 8, from_index // 8
+        to_col, to_row = to_index % 8, to_index // 8
 
         diff_col = abs(to_col - from_col)
         diff_row = abs(to_row - from_row)
@@ -198,54 +195,56 @@ class Game:
             return False
 
         # Check path is clear
-        return self._is_path_clear(from_sq, to_sq)
+        return self._is_path_clear(from_index, to_index)
 
-    def _is_valid_rook_move(self, from_sq: str, to_sq: str) -> bool:
+    def _is_valid_rook_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate rook moves (orthogonal)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
         # Must move in straight line (same row or column)
-        if from_col != to_col and from_row != to_row:
+        if from_index % 8 != to_index % 8 and from_index // 8 != to_index // 8:
             return False
 
         # Check path is clear
-        return self._is_path_clear(from_sq, to_sq)
+        return self._is_path_clear(from_index, to_index)
 
-    def _is_valid_queen_move(self, from_sq: str, to_sq: str) -> bool:
+    def _is_valid_queen_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate queen moves (diagonal or orthogonal)."""
-        return self._is_valid_bishop_move(from_sq, to_sq) or self._is_valid_rook_move(from_sq, to_sq)
+        return self._is_valid_bishop_move(from_index, to_index, color) or self._is_valid_rook_move(from_index, to_index, color)
 
-    def _is_valid_king_move(self, from_sq: str, to_sq: str, color: str) -> bool:
+    def _is_valid_king_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Validate king moves (one square any direction + castling)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
-        diff_col = abs(to_col - from_col)
-        diff_row = abs(to_row - from_row)
-
         # Normal king move (one square)
-        if diff_col <= 1 and diff_row <= 1:
+        if (KING_ATTACKS[from_index] >> to_index) & 1:
             return True
 
         # Castling (two squares horizontally)
-        if diff_col == 2 and diff_row == 0:
-            return self._can_castle(from_sq, to_sq, color)
+        if abs(to_index - from_index) == 2 and to_index // 8 == from_index // 8:
+            return self._can_castle(from_index, to_index, color)
 
         return False
 
-    def _can_castle(self, from_sq: str, to_sq: str, color: str) -> bool:
+    # Move validator for each piece type, all called as (self, from_index, to_index, color)
+    _VALIDATORS = {
+        PieceType.PAWN: _is_valid_pawn_move,
+        PieceType.KNIGHT: _is_valid_knight_move,
+        PieceType.BISHOP: _is_valid_bishop_move,
+        PieceType.ROOK: _is_valid_rook_move,
+        PieceType.QUEEN: _is_valid_queen_move,
+        PieceType.KING: _is_valid_king_move,
+    }
+
+    def _can_castle(self, from_index: int, to_index: int, color: str) -> bool:
         """Check if castling is legal."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
+        row_start = from_index - from_index % 8
 
         # Determine castling side
-        if to_col > from_col:
+        if to_index > from_index:
             side = 'kingside'
-            rook_col = 7
+            rook_index = row_start + 7
+            step = 1
         else:
             side = 'queenside'
-            rook_col = 0
+            rook_index = row_start
+            step = -1
 
         # Check castling rights
         if not self.castling_rights[color][side]:
@@ -256,90 +255,80 @@ class Game:
             return False
 
         # Check squares between king and rook are empty
-        step = 1 if to_col > from_col else -1
-        for col in range(from_col + step, rook_col, step):
-            sq = self._coords_to_square(col, from_row)
-            if self.board.grid.get(sq) is not None:
-                return False
+        if BETWEEN[from_index][rook_index] & self.board.occ:
+            return False
 
         # Check king doesn't pass through or land on attacked square
-        for col in range(from_col, to_col + step, step):
-            sq = self._coords_to_square(col, from_row)
-            if self._is_square_attacked(sq, 'white' if color == 'black' else 'black'):
+        opponent = 'white' if color == 'black' else 'black'
+        for index in range(from_index, to_index + step, step):
+            if self._is_square_attacked(index, opponent):
                 return False
 
         return True
 
-    def _is_path_clear(self, from_sq: str, to_sq: str) -> bool:
+    def _is_path_clear(self, from_index: int, to_index: int) -> bool:
         """Check if path between two squares is clear (for sliding pieces)."""
-        from_col, from_row = self._square_to_coords(from_sq)
-        to_col, to_row = self._square_to_coords(to_sq)
-
-        col_step = 0 if from_col == to_col else (1 if to_col > from_col else -1)
-        row_step = 0 if from_row == to_row else (1 if to_row > from_row else -1)
+        return not (BETWEEN[from_index][to_index] & self.board.occ)
 
-        current_col, current_row = from_col + col_step, from_row + row_step
-
-        while (current_col, current_row) != (to_col, to_row):
-            sq = self._coords_to_square(current_col, current_row)
-            if self.board.grid.get(sq) is not None:
-                return False
-            current_col += col_step
-            current_row += row_step
-
-        return True
-
-    def _execute_move(self, from_sq: str, to_sq: str, piece_type: PieceType, 
+    def _execute_move(self, from_index: int, to_index: int, piece_type: PieceType, 
                      piece_color: str, promotion_piece: Optional[PieceType]) -> Optional[PieceType]:
         """Execute a move on the board and handle special cases."""
+        self._board_state = None  # The serialized board is about to change
+        board = self.board
+
+        from_col, from_row = from_index % 8, from_index // 8
+        to_col, to_row = to_index % 8, to_index // 8
+
         # Capture piece if present
-        dest_piece = self.board.grid.get(to_sq)
+        dest_piece = board.grid[to_index]
         captured_piece = dest_piece[0] if dest_piece else None
 
+        # En passant: the captured pawn sits beside the destination, not on it
+        if piece_type == PieceType.PAWN and dest_piece is None and from_col != to_col:
+            passed_index = from_row * 8 + to_col
+            captured_piece = board.grid[passed_index][0]
+            board.clear_square(passed_index)
+
         # Move the piece
-        self.board.grid[to_sq] = (piece_type, piece_color)
-        self.board.grid[from_sq] = None
+        board.set_piece(to_index, (piece_type, piece_color))
+        board.clear_square(from_index)
 
         # Handle pawn promotion
-        to_col, to_row = self._square_to_coords(to_sq)
         if piece_type == PieceType.PAWN:
             if (piece_color == 'white' and to_row == 7) or (piece_color == 'black' and to_row == 0):
                 # Promote to queen by default if not specified
                 promo = promotion_piece if promotion_piece else PieceType.QUEEN
-                self.board.grid[to_sq] = (promo, piece_color)
+                board.set_piece(to_index, (promo, piece_color))
 
         # Handle castling (move rook)
         if piece_type == PieceType.KING:
-            from_col, from_row = self._square_to_coords(from_sq)
             diff_col = to_col - from_col
             if abs(diff_col) == 2:  # Castling occurred
                 if diff_col > 0:  # Kingside
-                    rook_from = self._coords_to_square(7, from_row)
-                    rook_to = self._coords_to_square(5, from_row)
+                    rook_from = from_row * 8 + 7
+                    rook_to = from_row * 8 + 5
                 else:  # Queenside
-                    rook_from = self._coords_to_square(0, from_row)
-                    rook_to = self._coords_to_square(3, from_row)
+                    rook_from = from_row * 8 + 0
+                    rook_to = from_row * 8 + 3
                 
-                rook_data = self.board.grid[rook_from]
-                self.board.grid[rook_to] = rook_data
-                self.board.grid[rook_from] = None
+                rook_data = board.grid[rook_from]
+                board.set_piece(rook_to, rook_data)
+                board.clear_square(rook_from)
 
         # Update castling rights
         if piece_type == PieceType.KING:
             self.castling_rights[piece_color]['kingside'] = False
             self.castling_rights[piece_color]['queenside'] = False
         elif piece_type == PieceType.ROOK:
-            from_col, from_row = self._square_to_coords(from_sq)
             if from_col == 0:
                 self.castling_rights[piece_color]['queenside'] = False
             elif from_col == 7:
                 self.castling_rights[piece_color]['kingside'] = False
 
         # Update en passant target
-        from_col, from_row = self._square_to_coords(from_sq)
         if piece_type == PieceType.PAWN and abs(to_row - from_row) == 2:
             ep_row = (from_row + to_row) // 2
-            self.en_passant_target = self._coords_to_square(from_col, ep_row)
+            self.en_passant_target = SQUARE_NAMES[ep_row * 8 + from_col]
         else:
             self.en_passant_target = None
 
@@ -354,64 +343,187 @@ class Game:
     def is_in_check(self, color: str) -> bool:
         """Check if the king of the given color is in check."""
         # Find king position
-        king_square = None
-        for square, piece_data in self.board.grid.items():
-            if piece_data and piece_data[0] == PieceType.KING and piece_data[1] == color:
-                king_square = square
-                break
-
-        if not king_square:
+        king_index = self.board.king_square(color)
+        if king_index is None:
             return False  # No king found (shouldn't happen in valid game)
 
         # Check if king square is attacked by opponent
         opponent_color = 'black' if color == 'white' else 'white'
-        return self._is_square_attacked(king_square, opponent_color)
-
-    def _is_square_attacked(self, square: str, by_color: str) -> bool:
-        """Check if a square is attacked by pieces of the given color."""
-        for from_sq, piece_data in self.board.grid.items():
-            if piece_data and piece_data[1] == by_color:
-                piece_type = piece_data[0]
-                # Check if this piece can attack the square
-                if self._is_valid_move(from_sq, square, piece_type, by_color):
+        return self._is_square_attacked(king_index, opponent_color)
+
+    def _is_square_attacked(self, target: int, by_color: str) -> bool:
+        """
+        Check if the square at grid index target is attacked by pieces of the given color.
+
+        Works backwards from the square: looks up which squares a pawn,
+        knight or king would have to stand on to reach it, and walks each
+        ray out to the first piece for the sliders. "Attacked" means the
+        same as _is_valid_move, so a pawn reaches an empty square by
+        pushing and an occupied (or en passant) square by capturing.
+        """
+        board = self.board
+        grid = board.grid
+        attackers = board.by_color[by_color]
+
+        # Nothing attacks a square held by its own side
+        target_piece = grid[target]
+        if target_piece is not None and target_piece[1] == by_color:
+            return False
+
+        # Pawns
+        pawns = attackers & board.by_piece[PieceType.PAWN]
+        if pawns:
+            other_color = 'black' if by_color == 'white' else 'white'
+            if target_piece is not None or SQUARE_NAMES[target] == self.en_passant_target:
+                # Capture: the pawn sits where the defender's pawn would attack from
+                if PAWN_ATTACKS[other_color][target] & pawns:
                     return True
+            else:
+                direction = 8 if by_color == 'white' else -8
+                one_back = target - direction
+                if 0 <= one_back < 64:
+                    if (pawns >> one_back) & 1:
+                        return True
+                    # Double push from the starting row over an empty square
+                    start_row = 1 if by_color == 'white' else 6
+                    two_back = one_back - direction
+                    if 0 <= two_back < 64 and two_back // 8 == start_row \
+                            and grid[one_back] is None and (pawns >> two_back) & 1:
+                        return True
+
+        # Knights and king: a single table lookup each
+        if KNIGHT_ATTACKS[target] & attackers & board.by_piece[PieceType.KNIGHT]:
+            return True
+        if KING_ATTACKS[target] & attackers & board.by_piece[PieceType.KING]:
+            return True
+
+        # Sliders last, and only the rays some attacker could use: the
+        # first piece along each ray is the only one that could slide here
+        queens = board.by_piece[PieceType.QUEEN]
+        straight_sliders = attackers & (board.by_piece[PieceType.ROOK] | queens)
+        diagonal_sliders = attackers & (board.by_piece[PieceType.BISHOP] | queens)
+
+        col, row = target % 8, target // 8
+        for sliders, directions in ((straight_sliders, ROOK_DIRECTIONS),
+                                    (diagonal_sliders, BISHOP_DIRECTIONS)):
+            if not sliders:
+                continue
+            for d_col, d_row in directions:
+                from_col, from_row = col + d_col, row + d_row
+                while 0 <= from_col < 8 and 0 <= from_row < 8:
+                    from_index = from_row * 8 + from_col
+                    if grid[from_index] is not None:
+                        if (sliders >> from_index) & 1:
+                            return True
+                        break
+                    from_col += d_col
+                    from_row += d_row
+
         return False
 
-    def _would_be_in_check_after_move(self, from_sq: str, to_sq: str, color: str) -> bool:
+    def _make_trial_move(self, from_index: int, to_index: int) -> tuple:
+        """
+        Move a piece for a look-ahead test, without any of the side effects of
+        _execute_move (castling rights, clocks, ...). Returns the undo record
+        to pass to _unmake_trial_move.
+        """
+        grid = self.board.grid
+        from_piece = grid[from_index]
+        to_piece = grid[to_index]
+
+        # En passant also removes the pawn beside the destination
+        passed_index = passed_piece = None
+        if from_piece[0] == PieceType.PAWN and to_piece is None and (to_index - from_index) % 8:
+            passed_index = from_index - from_index % 8 + to_index % 8
+            passed_piece = grid[passed_index]
+            self.board.clear_square(passed_index)
+
+        self.board.set_piece(to_index, from_piece)
+        self.board.clear_square(from_index)
+        return from_index, to_index, from_piece, to_piece, passed_index, passed_piece
+
+    def _unmake_trial_move(self, undo: tuple):
+        """Restore the board exactly as it was before _make_trial_move."""
+        from_index, to_index, from_piece, to_piece, passed_index, passed_piece = undo
+        self.board.set_piece(from_index, from_piece)
+        self.board.set_piece(to_index, to_piece)
+        if passed_index is not None:
+            self.board.set_piece(passed_index, passed_piece)
+
+    def _would_be_in_check_after_move(self, from_index: int, to_index: int, color: str) -> bool:
         """Test if a move would leave the player's king in check."""
-        # Save current state
-        from_piece = self.board.grid[from_sq]
-        to_piece = self.board.grid.get(to_sq)
+        undo = self._make_trial_move(from_index, to_index)
+        in_check = self.is_in_check(color)
+        self._unmake_trial_move(undo)
 
-        # Make temporary move
-        self.board.grid[to_sq] = from_piece
-        self.board.grid[from_sq] = None
+        return in_check
 
-        # Check if in check
-        in_check = self.is_in_check(color)
+    def _candidate_targets(self, index: int, piece_type: PieceType, color: str) -> int:
+        """
+        Bitboard of the squares a piece could possibly move to from index.
 
-        # Restore state
-        self.board.grid[from_sq] = from_piece
-        self.board.grid[to_sq] = to_piece
+        This is a superset of its valid moves (pawn pushes ignore blockers,
+        castling ignores castling rights, ...), so callers still run
+        _is_valid_move on each target. It just saves testing all 64 squares.
+        """
+        col, row = index % 8, index // 8
 
-        return in_check
+        if piece_type == PieceType.PAWN:
+            targets = PAWN_ATTACKS[color][index] | PAWN_PUSH[color][index] | PAWN_DOUBLE[color][index]
+        elif piece_type == PieceType.KNIGHT:
+            targets = KNIGHT_ATTACKS[index]
+        elif piece_type == PieceType.KING:
+            targets = KING_ATTACKS[index]
+            # Castling: two squares sideways
+            for to_col in (col - 2, col + 2):
+                if 0 <= to_col < 8:
+                    targets |= 1 << (row * 8 + to_col)
+        else:
+            # Sliding pieces: walk each direction until the first piece
+            grid = self.board.grid
+            targets = 0
+            for d_col, d_row in get_piece_directions(piece_type):
+                to_col, to_row = col + d_col, row + d_row
+                while 0 <= to_col < 8 and 0 <= to_row < 8:
+                    target = to_row * 8 + to_col
+                    targets |= 1 << target
+                    if grid[target] is not None:
+                        break
+                    to_col += d_col
+                    to_row += d_row
+
+        # Never onto our own pieces
+        return targets & ~self.board.by_color[color]
+
+    def _generate_pseudo_moves(self, color: str) -> Iterator[Tuple[int, int]]:
+        """Yield (from_index, to_index) for every candidate move of the given color."""
+        grid = self.board.grid
+        pieces = self.board.by_color[color]
+        while pieces:
+            lowest_bit = pieces & -pieces
+            pieces ^= lowest_bit
+            index = lowest_bit.bit_length() - 1
+
+            targets = self._candidate_targets(index, grid[index][0], color)
+            while targets:
+                target_bit = targets & -targets
+                targets ^= target_bit
+                yield index, target_bit.bit_length() - 1
 
     def _check_game_over(self):
         """Check for checkmate, stalemate, or draw conditions."""
         current_color = self.current_turn
 
-        # Get all legal moves for current player
+        # Look for any legal move of the current player, trying only the
+        # squares each piece could reach instead of all 64
         has_legal_move = False
-        for from_sq, piece_data in self.board.grid.items():
-            if piece_data and piece_data[1] == current_color:
-                piece_type = piece_data[0]
-                for to_sq in self.board.grid.keys():
-                    if self._is_valid_move(from_sq, to_sq, piece_type, current_color):
-                        if not self._would_be_in_check_after_move(from_sq, to_sq, current_color):
-                            has_legal_move = True
-                            break
-            if has_legal_move:
-                break
+        grid = self.board.grid
+        for from_index, to_index in self._generate_pseudo_moves(current_color):
+            piece_type = grid[from_index][0]
+            if self._is_valid_move(from_index, to_index, piece_type, current_color):
+                if not self._would_be_in_check_after_move(from_index, to_index, current_color):
+                    has_legal_move = True
+                    break
 
         if not has_legal_move:
             if self.is_in_check(current_color):
@@ -440,12 +552,21 @@ class Game:
         return {'success': True, 'message': 'Resignation accepted', 'winner': self.winner}
 
     def get_state(self) -> dict:
-        """Serialize complete game state to JSON-compatible dict."""
+        """
+        Serialize complete game state to JSON-compatible dict.
+
+        'board' only lists occupied squares (from_state treats missing
+        squares as empty). It is cached between moves and shared by every
+        call, so treat the returned state as read-only.
+        """
+        if self._board_state is None:
+            self._board_state = self._serialize_board()
+
         return {
             'white_player_id': self.white_player_id,
             'black_player_id': self.black_player_id,
             'current_turn': self.current_turn,
-            'board': {sq: (p[0].name, p[1]) if p else None for sq, p in self.board.grid.items()},
+            'board': self._board_state,
             'move_history': self.move_history,
             'status': self.status,
             'winner': self.winner,
@@ -455,6 +576,20 @@ class Game:
             'fullmove_number': self.fullmove_number
         }
 
+    def _serialize_board(self) -> Dict[str, Tuple[str, str]]:
+        """Map each occupied square to (piece name, color), walking the occupancy bits."""
+        grid = self.board.grid
+        board_state = {}
+        occupied = self.board.occ
+        while occupied:
+            lowest_bit = occupied & -occupied
+            occupied ^= lowest_bit
+            index = lowest_bit.bit_length() - 1
+
+            piece_type, color = grid[index]
+            board_state[SQUARE_NAMES[index]] = (piece_type.name, color)
+        return board_state
+
     @staticmethod
     def from_state(state: dict) -> 'Game':
         """Deserialize game from JSON state dict."""
@@ -468,23 +603,12 @@ class Game:
         game.halfmove_clock = state['halfmove_clock']
         game.fullmove_number = state['fullmove_number']
 
-        # Reconstruct board
+        # Reconstruct board in one go rather than square by square
+        grid = [None] * 64
+        name_to_piece_type = _NAME_TO_PIECE_TYPE
         for square, piece_data in state['board'].items():
             if piece_data:
-                piece_type = PieceType[piece_data[0]]
-                color = piece_data[1]
-                game.board.grid[square] = (piece_type, color)
-            else:
-                game.board.grid[square] = None
+                grid[SQUARE_INDEX[square]] = (name_to_piece_type[piece_data[0]], piece_data[1])
+        game.board.load_grid(grid)
 
         return game
-
-    def _square_to_coords(self, square: str) -> Tuple[int, int]:
-        """Convert square notation (e.g., 'e4') to coordinates (4, 3)."""
-        col = ord(square[0]) - ord('a')
-        row = int(square[1]) - 1
-        return col, row
-
-    def _coords_to_square(self, col: int, row: int) -> str:
-        """Convert coordinates (4, 3) to square notation ('e4')."""
-        return chr(col + ord('a')) + str(row + 1)
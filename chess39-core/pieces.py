@@ -1,25 +1,53 @@
 import enum
 
-class PieceType(enum.Enum):
+@enum.unique
+class PieceType(enum.IntEnum):
     """
     Represents the different types of pieces in Chess 39.
     Each piece is an "enumeration" member.
 
-    We assign the point value from the project plan 
-    as the value for each member.
+    Members are small unique ints (IntEnum), so comparisons and
+    dict lookups are as cheap as for plain ints. The point value
+    from the project plan is available as `piece.points`.
     """
 
-    # Piece values from the plan 
     PAWN = 1
-    KNIGHT = 3
+    KNIGHT = 2
     BISHOP = 3
-    ROOK = 5
-    QUEEN = 9
+    ROOK = 4
+    QUEEN = 5
+    KING = 6
+
+    @property
+    def points(self) -> int:
+        """Point value of this piece from the project plan."""
+        return PIECE_POINTS[self]
+
+
+# Piece values from the plan
+PIECE_POINTS = {
+    PieceType.PAWN: 1,
+    PieceType.KNIGHT: 3,
+    PieceType.BISHOP: 3,
+    PieceType.ROOK: 5,
+    PieceType.QUEEN: 9,
 
     # The King is special. its value is not
     # counted toward the 39 points.
     # We give it a value of 0 here to represent that.
-    KING = 0
+    PieceType.KING: 0,
+}
+
+
+# Board squares: the grid is a flat 64-element list indexed by row * 8 + col,
+# so a1 = 0, b1 = 1, ..., h1 = 7, a2 = 8, ..., h8 = 63.
+SQUARE_NAMES = tuple(f"{col}{row}" for row in '12345678' for col in 'abcdefgh')
+SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+
+def sq(col: int, row: int) -> int:
+    """Convert 0-based (col, row) coordinates to a grid index."""
+    return row * 8 + col
 
 
 # Movement patterns for each piece type
@@ -41,6 +69,77 @@ BISHOP_DIRECTIONS = [(1, 1), (1, -1), (-1, 1), (-1, -1)]  # Diagonal
 QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS  # Both
 
 
+def _build_step_attacks(offsets):
+    """
+    For every square, a bitboard of the squares one (col, row) offset away
+    that are still on the board. Indexed by square (row * 8 + col).
+    """
+    table = []
+    for index in range(64):
+        col, row = index % 8, index // 8
+        mask = 0
+        for d_col, d_row in offsets:
+            to_col, to_row = col + d_col, row + d_row
+            if 0 <= to_col < 8 and 0 <= to_row < 8:
+                mask |= 1 << sq(to_col, to_row)
+        table.append(mask)
+    return tuple(table)
+
+
+# Attack tables: bit N of TABLE[square] is set if the piece attacks square N.
+# e.g. (KNIGHT_ATTACKS[SQUARE_INDEX['g1']] >> SQUARE_INDEX['f3']) & 1 == 1
+KNIGHT_ATTACKS = _build_step_attacks(KNIGHT_MOVES)
+KING_ATTACKS = _build_step_attacks(KING_MOVES)
+
+# Pawns only attack diagonally forward, so the table depends on color
+PAWN_ATTACKS = {
+    'white': _build_step_attacks([(1, 1), (-1, 1)]),
+    'black': _build_step_attacks([(1, -1), (-1, -1)]),
+}
+
+# Pawn pushes: one square forward from anywhere, two only from the start row
+PAWN_PUSH = {
+    'white': _build_step_attacks([(0, 1)]),
+    'black': _build_step_attacks([(0, -1)]),
+}
+PAWN_DOUBLE = {
+    'white': tuple(1 << (index + 16) if index // 8 == 1 else 0 for index in range(64)),
+    'black': tuple(1 << (index - 16) if index // 8 == 6 else 0 for index in range(64)),
+}
+
+
+def _build_between():
+    """
+    BETWEEN[a][b] is a bitboard of the squares strictly between squares a and b
+    when they share a row, column or diagonal (0 otherwise, or if adjacent).
+    """
+    table = []
+    for from_index in range(64):
+        from_col, from_row = from_index % 8, from_index // 8
+        masks = []
+        for to_index in range(64):
+            to_col, to_row = to_index % 8, to_index // 8
+            d_col, d_row = to_col - from_col, to_row - from_row
+
+            mask = 0
+            if from_index != to_index and (d_col == 0 or d_row == 0 or abs(d_col) == abs(d_row)):
+                col_step = (d_col > 0) - (d_col < 0)
+                row_step = (d_row > 0) - (d_row < 0)
+                col, row = from_col + col_step, from_row + row_step
+                while (col, row) != (to_col, to_row):
+                    mask |= 1 << sq(col, row)
+                    col += col_step
+                    row += row_step
+            masks.append(mask)
+        table.append(tuple(masks))
+    return tuple(table)
+
+
+# Squares between two aligned squares, for sliding-piece path checks:
+# the path is clear when BETWEEN[a][b] & occupied == 0
+BETWEEN = _build_between()
+
+
 def get_piece_directions(piece_type: PieceType):
     """
     Returns the movement directions for a given piece type.
@@ -67,4 +166,4 @@ def get_piece_directions(piece_type: PieceType):
 if __name__ == "__main__":
     print("\nAll Pieces:")
     for piece in PieceType:
-        print(f"  - {piece.name:6} (Value: {piece.value})")
\ No newline at end of file
+        print(f"  - {piece.name:6} (Value: {piece.points})")
\ No newline at end of file
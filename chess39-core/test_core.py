@@ -4,14 +4,16 @@ Simple test to verify Chess 39 core logic is working correctly.
 
 import sys
 import os
+import random
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from pieces import PieceType
-from army import generate_random_army
+from pieces import PieceType, SQUARE_NAMES, SQUARE_INDEX, KNIGHT_ATTACKS, BETWEEN
+from army import generate_random_army, _VALID_ARMIES
 from board import Board
 from game import Game
+from fen import board_to_fen, fen_to_board
 
 
 def test_army_generation():
@@ -19,8 +21,8 @@ def test_army_generation():
     print("Testing Army Generation...")
     
     for i in range(3):
-        army = generate_random_army()
-        total_points = sum(p.value for p in army)
+        army = generate_random_army().as_list()
+        total_points = sum(p.points for p in army)
         num_pawns = sum(1 for p in army if p == PieceType.PAWN)
         has_king = PieceType.KING in army
         
@@ -40,8 +42,8 @@ def test_board_setup():
     board.setup_board()
     
     # Count pieces
-    white_pieces = sum(1 for p in board.grid.values() if p and p[1] == 'white')
-    black_pieces = sum(1 for p in board.grid.values() if p and p[1] == 'black')
+    white_pieces = sum(1 for p in board.grid if p and p[1] == 'white')
+    black_pieces = sum(1 for p in board.grid if p and p[1] == 'black')
     
     print(f"  White pieces: {white_pieces}")
     print(f"  Black pieces: {black_pieces}")
@@ -59,8 +61,9 @@ def test_basic_moves():
     
     # Find a pawn to move
     white_pawn_square = None
-    for square, piece_data in game.board.grid.items():
+    for index, piece_data in enumerate(game.board.grid):
         if piece_data and piece_data[0] == PieceType.PAWN and piece_data[1] == 'white':
+            square = SQUARE_NAMES[index]
             col, row = square[0], int(square[1])
             if row == 2:  # Pawn on starting rank
                 white_pawn_square = square
@@ -117,6 +120,337 @@ def test_game_state_serialization():
     print("✓ Game state serialization working\n")
 
 
+def test_fen_round_trip():
+    """Test that a position survives board_to_fen -> fen_to_board."""
+    print("Testing FEN Round Trip...")
+    
+    game = Game("player1", "player2")
+    game.start_game()
+    game.castling_rights['black']['kingside'] = False
+    game.en_passant_target = 'e3'
+    game.halfmove_clock = 4
+    game.fullmove_number = 12
+    
+    fen = board_to_fen(game.board.grid, game.current_turn, game.castling_rights,
+                       game.en_passant_target, game.halfmove_clock, game.fullmove_number)
+    print(f"  FEN: {fen}")
+    grid, current_turn, castling_rights, en_passant_target, halfmove_clock, fullmove_number = fen_to_board(fen)
+    
+    assert grid == game.board.grid, "Board changed in the round trip"
+    assert current_turn == game.current_turn
+    assert castling_rights == game.castling_rights
+    assert en_passant_target == 'e3'
+    assert (halfmove_clock, fullmove_number) == (4, 12)
+    assert board_to_fen(grid, current_turn, castling_rights, en_passant_target,
+                        halfmove_clock, fullmove_number) == fen
+    print("✓ FEN round trip working\n")
+
+
+def test_fen_rejects_malformed():
+    """Test that malformed FEN records raise ValueError."""
+    print("Testing Malformed FEN Rejection...")
+    
+    malformed = [
+        '8p/8/8/8/8/8/8/8 w - - 0 1',    # Piece past the end of a rank
+        '8/8/8/8/8/8/8/44p w - - 0 1',   # Rank describes 9 squares
+        '8/8/8/8/8/8/8/7 w - - 0 1',     # Rank describes 7 squares
+        '8/8/8/8/8/8/8 w - - 0 1',       # Only 7 ranks
+        '8/8/8/8/8/8/8/7x w - - 0 1',    # Not a piece letter
+        '8/8/8/8/8/8/8/8 x - - 0 1',     # Bad active color
+        '',
+    ]
+    for fen in malformed:
+        try:
+            fen_to_board(fen)
+        except ValueError:
+            continue
+        raise AssertionError(f"Malformed FEN was accepted: {fen!r}")
+    print(f"  Rejected {len(malformed)} malformed records")
+    print("✓ Malformed FEN rejection working\n")
+
+
+def make_position(pieces, turn='white', en_passant_target=None):
+    """Build a Game from {square: (PieceType, color)} with no castling rights."""
+    grid = [None] * 64
+    for square, piece_data in pieces.items():
+        grid[SQUARE_INDEX[square]] = piece_data
+    
+    game = Game("player1", "player2")
+    game.board.load_grid(grid)
+    game.current_turn = turn
+    game.en_passant_target = en_passant_target
+    game.castling_rights = {
+        'white': {'kingside': False, 'queenside': False},
+        'black': {'kingside': False, 'queenside': False}
+    }
+    return game
+
+
+def bitboard(*squares):
+    """Bitboard with the given squares set."""
+    mask = 0
+    for square in squares:
+        mask |= 1 << SQUARE_INDEX[square]
+    return mask
+
+
+WHITE_KING = (PieceType.KING, 'white')
+BLACK_KING = (PieceType.KING, 'black')
+
+
+def test_army_invariants():
+    """Test every precomputed army, not just a few random draws."""
+    print("Testing Army Invariants...")
+    
+    for army in _VALID_ARMIES:
+        pieces = army.as_list()
+        assert sum(p.points for p in pieces) == 39, f"Army does not sum to 39: {army}"
+        assert army.pawn_count <= 8, f"Too many pawns: {army}"
+        assert len(army.majors) <= 7, f"Too many majors for the back rank: {army}"
+        assert pieces.count(PieceType.KING) == 1, f"Army needs exactly one king: {army}"
+    
+    assert len(set(_VALID_ARMIES)) == len(_VALID_ARMIES), "Duplicate armies"
+    
+    # Every army must fit, so the board holds the full 39 points for each side
+    for _ in range(200):
+        board = Board()
+        board.setup_board()
+        for color in ('white', 'black'):
+            material = sum(p[0].points for p in board.grid if p and p[1] == color)
+            assert material == 39, f"{color} has {material} points on the board"
+    assert any(PieceType.BISHOP in army.majors for army in _VALID_ARMIES), "No army has a bishop"
+    assert any(PieceType.KNIGHT in army.majors for army in _VALID_ARMIES), "No army has a knight"
+    print(f"  Checked {len(_VALID_ARMIES)} armies")
+    print("✓ Army invariants hold\n")
+
+
+def test_attack_tables():
+    """Spot-check the precomputed KNIGHT_ATTACKS and BETWEEN tables."""
+    print("Testing Attack Tables...")
+    
+    assert KNIGHT_ATTACKS[SQUARE_INDEX['g1']] == bitboard('e2', 'f3', 'h3')
+    assert KNIGHT_ATTACKS[SQUARE_INDEX['a1']] == bitboard('b3', 'c2')
+    assert KNIGHT_ATTACKS[SQUARE_INDEX['d4']] == bitboard('b3', 'b5', 'c2', 'c6', 'e2', 'e6', 'f3', 'f5')
+    
+    assert BETWEEN[SQUARE_INDEX['a1']][SQUARE_INDEX['h8']] == bitboard('b2', 'c3', 'd4', 'e5', 'f6', 'g7')
+    assert BETWEEN[SQUARE_INDEX['a1']][SQUARE_INDEX['a8']] == bitboard('a2', 'a3', 'a4', 'a5', 'a6', 'a7')
+    assert BETWEEN[SQUARE_INDEX['h1']][SQUARE_INDEX['c1']] == bitboard('d1', 'e1', 'f1', 'g1')
+    assert BETWEEN[SQUARE_INDEX['a1']][SQUARE_INDEX['a8']] == BETWEEN[SQUARE_INDEX['a8']][SQUARE_INDEX['a1']]
+    assert BETWEEN[SQUARE_INDEX['e4']][SQUARE_INDEX['e5']] == 0  # Adjacent
+    assert BETWEEN[SQUARE_INDEX['a1']][SQUARE_INDEX['b3']] == 0  # Not on a line
+    print("✓ Attack tables correct\n")
+
+
+def test_check_and_blocked_slider():
+    """Test check detection and that a blocked slider gives no check."""
+    print("Testing Check Detection...")
+    
+    game = make_position({'e1': WHITE_KING, 'e8': (PieceType.ROOK, 'black'), 'a8': BLACK_KING})
+    assert game.is_in_check('white'), "Rook on the open e-file should give check"
+    assert not game.is_in_check('black')
+    
+    game = make_position({'e1': WHITE_KING, 'e2': (PieceType.PAWN, 'white'),
+                          'e8': (PieceType.ROOK, 'black'), 'a8': BLACK_KING})
+    assert not game.is_in_check('white'), "Blocked rook should not give check"
+    
+    game = make_position({'a1': (PieceType.ROOK, 'white'), 'a3': (PieceType.PAWN, 'white'),
+                          'h1': WHITE_KING, 'h8': BLACK_KING})
+    result = game.make_move('a1', 'a5', 'player1')
+    assert not result['success'], "Rook should not jump over its own pawn"
+    
+    game = make_position({'h1': WHITE_KING, 'b7': (PieceType.BISHOP, 'black'),
+                          'd5': (PieceType.KNIGHT, 'black'), 'a8': BLACK_KING}, turn='black')
+    assert not game.is_in_check('white'), "Bishop is blocked on the long diagonal"
+    result = game.make_move('d5', 'f6', 'player2', compute_check=True)
+    assert result['success'] and result['is_check'], "Moving the knight should give discovered check"
+    print("✓ Check detection working\n")
+
+
+def test_pinned_piece():
+    """Test that a pinned piece cannot leave the pin line."""
+    print("Testing Pinned Piece...")
+    
+    game = make_position({'e1': WHITE_KING, 'e2': (PieceType.BISHOP, 'white'),
+                          'e8': (PieceType.ROOK, 'black'), 'a8': BLACK_KING})
+    result = game.make_move('e2', 'd3', 'player1')
+    print(f"  Pinned bishop e2 to d3: {result['message']}")
+    assert not result['success']
+    assert result['message'] == 'Move would leave king in check'
+    
+    game = make_position({'e1': WHITE_KING, 'e2': (PieceType.ROOK, 'white'),
+                          'e8': (PieceType.ROOK, 'black'), 'a8': BLACK_KING})
+    result = game.make_move('e2', 'e5', 'player1')
+    assert result['success'], "A pinned rook may still move along the pin"
+    print("✓ Pinned piece handling working\n")
+
+
+def test_checkmate_and_stalemate():
+    """Test that game over is detected after the deciding move."""
+    print("Testing Checkmate and Stalemate...")
+    
+    # Back-rank mate: the king is boxed in by its own pawns
+    game = make_position({'h1': WHITE_KING, 'g2': (PieceType.PAWN, 'white'), 'h2': (PieceType.PAWN, 'white'),
+                          'a8': (PieceType.ROOK, 'black'), 'g8': BLACK_KING}, turn='black')
+    result = game.make_move('a8', 'a1', 'player2', compute_check=True)
+    print(f"  Ra8-a1: status={result['status']}")
+    assert result['success'] and result['is_check']
+    assert game.status == 'checkmate' and game.winner == 'black'
+    
+    # Queen to c7 leaves the cornered king no move but not in check
+    game = make_position({'b6': WHITE_KING, 'c1': (PieceType.QUEEN, 'white'), 'a8': BLACK_KING})
+    result = game.make_move('c1', 'c7', 'player1', compute_check=True)
+    print(f"  Qc1-c7: status={result['status']}")
+    assert result['success'] and not result['is_check']
+    assert game.status == 'stalemate' and game.winner is None
+    
+    # A check the king can walk out of is not mate
+    game = make_position({'e1': WHITE_KING, 'a2': (PieceType.ROOK, 'black'), 'h8': BLACK_KING}, turn='black')
+    result = game.make_move('a2', 'a1', 'player2', compute_check=True)
+    assert result['is_check'] and game.status == 'ongoing'
+    print("✓ Checkmate and stalemate detection working\n")
+
+
+def test_pawn_moves():
+    """Test pawn pushes, double pushes and en passant."""
+    print("Testing Pawn Moves...")
+    
+    # A pawn "attacks" the squares it can move to, double push included
+    game = make_position({'e2': (PieceType.PAWN, 'white'), 'a1': WHITE_KING, 'h8': BLACK_KING})
+    assert game._is_square_attacked(SQUARE_INDEX['e4'], 'white')
+    assert game._is_square_attacked(SQUARE_INDEX['e3'], 'white')
+    assert not game._is_square_attacked(SQUARE_INDEX['d3'], 'white'), "No capture onto an empty square"
+    
+    game.board.set_piece(SQUARE_INDEX['e3'], (PieceType.KNIGHT, 'black'))
+    assert not game._is_square_attacked(SQUARE_INDEX['e4'], 'white'), "Double push is blocked"
+    assert not game.make_move('e2', 'e4', 'player1')['success']
+    
+    # Double push from the start rank only
+    game = make_position({'e2': (PieceType.PAWN, 'white'), 'd3': (PieceType.PAWN, 'white'),
+                          'a1': WHITE_KING, 'h8': BLACK_KING})
+    assert not game.make_move('d3', 'd5', 'player1')['success']
+    assert game.make_move('e2', 'e4', 'player1')['success']
+    assert game.en_passant_target == 'e3'
+    
+    # En passant: black double-pushes past the white pawn, which takes it
+    game = make_position({'e5': (PieceType.PAWN, 'white'), 'd7': (PieceType.PAWN, 'black'),
+                          'a1': WHITE_KING, 'h8': BLACK_KING}, turn='black')
+    assert game.make_move('d7', 'd5', 'player2')['success']
+    assert game.en_passant_target == 'd6'
+    result = game.make_move('e5', 'd6', 'player1')
+    print(f"  e5xd6 en passant: {result['message']}, captured={result['captured']}")
+    assert result['success'] and result['captured'] == 'PAWN'
+    assert game.board.grid[SQUARE_INDEX['d5']] is None, "Captured pawn should be removed"
+    assert game.board.grid[SQUARE_INDEX['d6']] == (PieceType.PAWN, 'white')
+    print("✓ Pawn moves working\n")
+
+
+def brute_force_attacked(grid, target, by_color, en_passant_target):
+    """
+    The baseline definition of "attacked": some piece of by_color could move
+    to target (pawn pushes count, castling doesn't). Plain coordinate
+    arithmetic, deliberately sharing nothing with the bitboard code.
+    """
+    target_piece = grid[target]
+    if target_piece is not None and target_piece[1] == by_color:
+        return False
+    to_col, to_row = target % 8, target // 8
+    
+    for index, piece_data in enumerate(grid):
+        if piece_data is None or piece_data[1] != by_color:
+            continue
+        piece_type = piece_data[0]
+        from_col, from_row = index % 8, index // 8
+        d_col, d_row = to_col - from_col, to_row - from_row
+        
+        if piece_type == PieceType.PAWN:
+            direction = 1 if by_color == 'white' else -1
+            start_row = 1 if by_color == 'white' else 6
+            if d_col == 0 and d_row == direction and target_piece is None:
+                return True
+            if d_col == 0 and d_row == 2 * direction and from_row == start_row and target_piece is None \
+                    and grid[index + 8 * direction] is None:
+                return True
+            if abs(d_col) == 1 and d_row == direction and \
+                    (target_piece is not None or SQUARE_NAMES[target] == en_passant_target):
+                return True
+        elif piece_type == PieceType.KNIGHT:
+            if sorted((abs(d_col), abs(d_row))) == [1, 2]:
+                return True
+        elif piece_type == PieceType.KING:
+            if max(abs(d_col), abs(d_row)) == 1:
+                return True
+        else:
+            straight = d_col == 0 or d_row == 0
+            diagonal = abs(d_col) == abs(d_row)
+            if (d_col, d_row) == (0, 0):
+                continue
+            if not ((straight and piece_type in (PieceType.ROOK, PieceType.QUEEN)) or
+                    (diagonal and piece_type in (PieceType.BISHOP, PieceType.QUEEN))):
+                continue
+            step_col = (d_col > 0) - (d_col < 0)
+            step_row = (d_row > 0) - (d_row < 0)
+            col, row = from_col + step_col, from_row + step_row
+            while (col, row) != (to_col, to_row) and grid[row * 8 + col] is None:
+                col += step_col
+                row += step_row
+            if (col, row) == (to_col, to_row):
+                return True
+    return False
+
+
+def test_against_brute_force():
+    """
+    Play seeded random games and compare the fast attack test and move
+    generator with brute force after every move.
+    """
+    print("Testing Attacks and Move Generation Against Brute Force...")
+    
+    saved_state = random.getstate()
+    random.seed(39)
+    rng = random.Random(39)
+    squares_checked = moves_checked = 0
+    try:
+        for _ in range(20):
+            game = Game("player1", "player2")
+            game.start_game()
+            
+            for _ in range(40):
+                grid = game.board.grid
+                for target in range(64):
+                    for color in ('white', 'black'):
+                        expected = brute_force_attacked(grid, target, color, game.en_passant_target)
+                        assert game._is_square_attacked(target, color) == expected, \
+                            f"{SQUARE_NAMES[target]} attacked by {color}: expected {expected}"
+                        squares_checked += 1
+                
+                # Every legal move must come out of the pseudo-move generator
+                color = game.current_turn
+                legal = []
+                for from_index, piece_data in enumerate(grid):
+                    if piece_data is None or piece_data[1] != color:
+                        continue
+                    for to_index in range(64):
+                        if game._is_valid_move(from_index, to_index, piece_data[0], color) and \
+                                not game._would_be_in_check_after_move(from_index, to_index, color):
+                            legal.append((from_index, to_index))
+                generated = set(game._generate_pseudo_moves(color))
+                assert set(legal) <= generated, "Move generator missed a legal move"
+                moves_checked += len(legal)
+                
+                if not legal or game.status != 'ongoing':
+                    break
+                from_index, to_index = rng.choice(legal)
+                player_id = "player1" if color == 'white' else "player2"
+                result = game.make_move(SQUARE_NAMES[from_index], SQUARE_NAMES[to_index], player_id,
+                                        PieceType.QUEEN)
+                assert result['success'], result['message']
+    finally:
+        random.setstate(saved_state)
+    
+    print(f"  Compared {squares_checked} attack lookups and {moves_checked} legal moves")
+    print("✓ Fast paths match brute force\n")
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("Chess 39 Core Logic Test Suite")
@@ -128,6 +462,15 @@ if __name__ == "__main__":
         test_basic_moves()
         test_invalid_moves()
         test_game_state_serialization()
+        test_fen_round_trip()
+        test_fen_rejects_malformed()
+        test_army_invariants()
+        test_attack_tables()
+        test_check_and_blocked_slider()
+        test_pinned_piece()
+        test_checkmate_and_stalemate()
+        test_pawn_moves()
+        test_against_brute_force()
         
         print("=" * 50)
         print("✅ All tests passed!")